@@ -1 +1 @@
-__all__ = ['adaptable_heap_priority_queue', 'heap_priority_queue', 'sorted_priority_queue', 'unsorted_priority_queue']
+__all__ = ['adaptable_heap_priority_queue', 'bucket_priority_queue', 'heap_priority_queue', 'sorted_priority_queue', 'unsorted_priority_queue']
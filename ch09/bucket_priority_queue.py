@@ -0,0 +1,87 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .priority_queue_base import PriorityQueueBase
+from ..exceptions import Empty
+
+class BucketPriorityQueue(PriorityQueueBase):
+  """A monotone min-oriented priority queue for small integer keys.
+
+  This is Dial's bucket structure.  Keys must be nonnegative integers, and no
+  key may be smaller than the most recently removed key (as is the case for
+  the distances removed by Dijkstra's algorithm), nor larger than it by more
+  than the span given to the constructor.  Under those rules every pending key
+  lies in a window of span+1 consecutive integers, so a circular array with one
+  bucket per key replaces the comparisons of a heap.
+  """
+
+  #------------------------------ public behaviors ------------------------------
+  def __init__(self, span):
+    """Create an empty queue for keys up to span above the current minimum."""
+    if span < 0:
+      raise ValueError('span must be nonnegative')
+    self._buckets = [[] for j in range(span + 1)]  # key k at index k % (span+1)
+    self._span = span
+    self._cursor = 0                   # no pending key is smaller than this
+    self._size = 0
+
+  def __len__(self):
+    """Return the number of items in the priority queue."""
+    return self._size
+
+  def _advance(self):
+    """Move the cursor to the smallest pending key (queue must be nonempty)."""
+    buckets, width = self._buckets, len(self._buckets)
+    while not buckets[self._cursor % width]:
+      self._cursor += 1
+
+  def add(self, key, value):
+    """Add a key-value pair to the priority queue.
+
+    Raise ValueError if key lies outside the window of allowed keys.
+    """
+    if not self._cursor <= key <= self._cursor + self._span:
+      raise ValueError('key outside the monotone window of the queue')
+    self._buckets[key % len(self._buckets)].append(value)
+    self._size += 1
+
+  def min(self):
+    """Return but do not remove (k,v) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self.is_empty():
+      raise Empty('Priority queue is empty.')
+    self._advance()
+    bucket = self._buckets[self._cursor % len(self._buckets)]
+    return (self._cursor, bucket[-1])
+
+  def remove_min(self):
+    """Remove and return (k,v) tuple with minimum key.
+
+    Raise Empty exception if empty.
+    """
+    if self.is_empty():
+      raise Empty('Priority queue is empty.')
+    self._advance()
+    self._size -= 1
+    bucket = self._buckets[self._cursor % len(self._buckets)]
+    return (self._cursor, bucket.pop())
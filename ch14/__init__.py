@@ -1 +1 @@
-__all__ = ['bfs', 'dfs', 'graph', 'graph_examples', 'mst', 'partition', 'shortest_paths', 'topological_sort', 'transitive_closure']
+__all__ = ['benchmark', 'bfs', 'components', 'concurrent_graph', 'contraction_hierarchy', 'csr_graph', 'dag_scheduler', 'dense_graph', 'dfs', 'dynamic_topological_order', 'graph', 'graph_examples', 'graph_loader', 'graph_store', 'graph_view', 'landmarks', 'mst', 'multi_source', 'partition', 'scc', 'shortest_paths', 'topological_sort', 'transitive_closure']
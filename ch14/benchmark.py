@@ -0,0 +1,145 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Time the algorithms of this chapter on synthetic graphs and write the
+# results in machine-readable form.
+# Run as a module, e.g.:
+#
+#   python -m package.ch14.benchmark --vertices 100000 --json results.json
+#
+# Each result records the graph family, its size, the algorithm, and the
+# best time in seconds over the requested number of repetitions. Transitive
+# closure is timed on a smaller graph of each family (see --closure-limit).
+
+import argparse
+import csv
+import json
+import sys
+from time import perf_counter
+from .graph_examples import erdos_renyi_graph, grid_graph
+from .graph_examples import barabasi_albert_graph, random_dag
+from .bfs import BFS_complete
+from .dfs import DFS_complete
+from .shortest_paths import shortest_path_lengths
+from .shortest_paths import heap_shortest_path_lengths
+from .mst import MST_PrimJarnik, MST_Kruskal
+from .topological_sort import topological_sort
+from .transitive_closure import transitive_closure
+
+FIELDS = ('graph', 'vertices', 'edges', 'algorithm', 'seconds')
+
+def _source(g):
+  return next(iter(g.vertices()))
+
+# algorithm name, function of the graph, and whether it needs an undirected
+# graph (True), a directed acyclic graph (False), or any graph (None);
+# 'dijkstra' chooses its own queue (buckets, for these small integer weights)
+# and 'dijkstra_heap' always uses the heap-based version
+ALGORITHMS = (
+  ('bfs', BFS_complete, None),
+  ('dfs', DFS_complete, None),
+  ('dijkstra', lambda g: shortest_path_lengths(g, _source(g)), None),
+  ('dijkstra_heap', lambda g: heap_shortest_path_lengths(g, _source(g)), None),
+  ('prim', MST_PrimJarnik, True),
+  ('kruskal', MST_Kruskal, True),
+  ('topological_sort', topological_sort, False),
+  ('transitive_closure', transitive_closure, None),
+)
+
+def make_graphs(n, seed=0):
+  """Return a list of (name, graph) pairs of about n vertices each."""
+  side = max(1, int(n ** 0.5))
+  return [
+    ('erdos_renyi', erdos_renyi_graph(n, 4 * n, max_weight=100, seed=seed)),
+    ('grid', grid_graph(side, side, max_weight=100, seed=seed)),
+    ('barabasi_albert', barabasi_albert_graph(n, 4, max_weight=100,
+                                              seed=seed)),
+    ('random_dag', random_dag(n, 4 * n, max_weight=100, seed=seed)),
+  ]
+
+def best_time(f, g, repeat):
+  """Return the shortest time in seconds of repeat calls f(g)."""
+  best = float('inf')
+  for k in range(repeat):
+    start = perf_counter()
+    f(g)
+    best = min(best, perf_counter() - start)
+  return best
+
+def run(n, repeat=3, seed=0, closure_limit=1000, report=None):
+  """Run every applicable algorithm on each graph family and return results.
+
+  Results are dictionaries with the keys of FIELDS. Transitive closure,
+  whose output may have n^2 edges, is run on a separate graph of the same
+  family with about closure_limit vertices when n is larger, and its result
+  records the size of that graph. If report is given, it is called with
+  each result.
+  """
+  results = []
+  small = None                          # family name to graph for closure
+  for name, g in make_graphs(n, seed):
+    for algorithm, f, undirected in ALGORITHMS:
+      if undirected is not None and undirected == g.is_directed():
+        continue                        # wrong kind of graph
+      h = g
+      if f is transitive_closure and g.vertex_count() > closure_limit:
+        if small is None:
+          small = dict(make_graphs(closure_limit, seed))
+        h = small[name]
+      result = dict(graph=name, vertices=h.vertex_count(),
+                    edges=h.edge_count(), algorithm=algorithm,
+                    seconds=best_time(f, h, repeat))
+      results.append(result)
+      if report is not None:
+        report(result)
+  return results
+
+def write_json(results, path):
+  with open(path, 'w') as f:
+    json.dump(results, f, indent=1)
+
+def write_csv(results, path):
+  with open(path, 'w', newline='') as f:
+    writer = csv.DictWriter(f, FIELDS)
+    writer.writeheader()
+    writer.writerows(results)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+    description='Time ch14 algorithms on synthetic graphs.')
+  parser.add_argument('--vertices', type=int, default=10000)
+  parser.add_argument('--repeat', type=int, default=3)
+  parser.add_argument('--seed', type=int, default=0)
+  parser.add_argument('--closure-limit', type=int, default=1000)
+  parser.add_argument('--json', help='file for results as a JSON list')
+  parser.add_argument('--csv', help='file for results as CSV rows')
+  args = parser.parse_args()
+  def show(result):
+    print('{graph:>16} {vertices:>9} {edges:>9} {algorithm:>18} '
+          '{seconds:>9.3f}'.format(**result), file=sys.stderr)
+  results = run(args.vertices, args.repeat, args.seed, args.closure_limit,
+                show)
+  if args.json:
+    write_json(results, args.json)
+  if args.csv:
+    write_csv(results, args.csv)
+  if not args.json and not args.csv:
+    json.dump(results, sys.stdout, indent=1)
@@ -19,33 +19,162 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-def BFS(g, s, discovered):
+from .csr_graph import CSRGraph
+
+def BFS(g, s, discovered, discover=None, finish=None, tree_edge=None,
+        cross_edge=None, back_edge=None):
   """Perform BFS of the undiscovered portion of Graph g starting at Vertex s.
 
   discovered is a dictionary mapping each vertex to the edge that was used to
   discover it during the BFS (s should be mapped to None prior to the call).
   Newly discovered vertices will be added to the dictionary as a result.
+
+  Each optional callback is invoked as the corresponding event occurs:
+  discover(v) when v is reached, finish(v) once its edges are explored,
+  tree_edge(e) for an edge that discovers a vertex, and cross_edge(e) for
+  every other edge to an already discovered vertex.  For an undirected graph,
+  each nontree edge is reported once.
+
+  A BFS has no forward edges, but in a directed graph a nontree edge may lead
+  back to an ancestor in the BFS tree.  If back_edge is given, back_edge(e)
+  is called for those edges and cross_edge(e) only for the rest; since the
+  ancestor test needs the whole tree, both are then called after the search
+  from s is complete.  An undirected graph has no back edges in a BFS.
+  """
+  undirected = not g.is_directed()
+  finished = set()                   # only maintained if reporting cross edges
+  deferred = [] if back_edge is not None and not undirected else None
+  if discover is not None:
+    discover(s)
+  queue = [s]                        # vertices in order of discovery
+  if cross_edge is None and back_edge is None and isinstance(g, CSRGraph):
+    # only tree edges are needed, so scan the arrays and make just those
+    offsets, targets, Edge = g._offsets, g._targets, g.Edge
+    for u in queue:
+      for k in range(offsets[u], offsets[u+1]):
+        v = targets[k]
+        if v not in discovered:
+          e = discovered[v] = Edge(g, u, v, k)
+          if tree_edge is not None:
+            tree_edge(e)
+          if discover is not None:
+            discover(v)
+          queue.append(v)
+      if finish is not None:
+        finish(u)
+    return
+  for u in queue:                    # iteration continues as queue grows
+    for v, e in g.neighbors(u):      # for every outgoing edge e=(u,v)
+      if v not in discovered:        # v is an unvisited vertex
+        discovered[v] = e            # e is the tree edge that discovered v
+        if tree_edge is not None:
+          tree_edge(e)
+        if discover is not None:
+          discover(v)
+        queue.append(v)              # v will be explored after earlier levels
+      elif deferred is not None:
+        deferred.append((u, v, e))   # classified once the tree is complete
+      elif cross_edge is not None:
+        if undirected and (v in finished or e == discovered[u]):
+          continue                   # edge already reported, or the tree edge
+        cross_edge(e)
+    if cross_edge is not None:
+      finished.add(u)
+    if finish is not None:
+      finish(u)
+  if deferred:
+    first, last = _tree_intervals(queue, discovered)
+    for u, v, e in deferred:         # v is an ancestor of u if it encloses u
+      if v in first and first[v] <= first[u] and last[u] <= last[v]:
+        back_edge(e)
+      elif cross_edge is not None:
+        cross_edge(e)
+
+def _tree_intervals(queue, discovered):
+  """Return (first, last) maps of times for a DFS of the tree found by BFS.
+
+  queue lists the vertices of the tree in order of discovery, beginning with
+  its root, and discovered maps each other vertex to its tree edge.  A vertex
+  v is an ancestor of u (or u itself) if and only if the interval from
+  first[v] to last[v] encloses that of u.
   """
-  level = [s]                        # first level includes only s
-  while len(level) > 0:
-    next_level = []                  # prepare to gather newly found vertices
-    for u in level:
-      for e in g.incident_edges(u):  # for every outgoing edge from u
-        v = e.opposite(u)
-        if v not in discovered:      # v is an unvisited vertex
-          discovered[v] = e          # e is the tree edge that discovered v
-          next_level.append(v)       # v will be further considered in next pass
-    level = next_level               # relabel 'next' level to become current
-
-def BFS_complete(g):
+  children = {u: [] for u in queue}
+  for v in queue[1:]:
+    children[discovered[v].opposite(v)].append(v)
+  first, last = {}, {}
+  clock = 0
+  stack = [(queue[0], False)]
+  while stack:
+    u, done = stack.pop()
+    if done:
+      last[u] = clock
+    else:
+      first[u] = clock
+      stack.append((u, True))        # finish u after all of its descendants
+      stack.extend((c, False) for c in children[u])
+    clock += 1
+  return first, last
+
+def BFS_complete(g, discover=None, finish=None, tree_edge=None,
+                 cross_edge=None, back_edge=None):
   """Perform BFS for entire graph and return forest as a dictionary.
 
   Result maps each vertex v to the edge that was used to discover it.
   (vertices that are roots of a BFS tree are mapped to None).
+  Optional callbacks are passed to each call of BFS.
   """
   forest = {}
   for u in g.vertices():
     if u not in forest:
       forest[u] = None            # u will be a root of a tree
-      BFS(g, u, forest)
+      BFS(g, u, forest, discover, finish, tree_edge, cross_edge, back_edge)
   return forest
+
+def bidirectional_BFS(g, s, t, touched=None):
+  """Return a list of vertices comprising a shortest path from s to t.
+
+  The path has the fewest possible edges, and None is returned if t is not
+  reachable from s. Breadth-first searches grow from s (along outgoing edges)
+  and from t (along incoming edges), each step expanding a whole level of
+  whichever frontier is smaller, until the two searches meet.
+
+  If touched is given as an empty dictionary, each vertex discovered by
+  either search is added to it, mapped to its number of edges from s or t.
+  """
+  if isinstance(g, CSRGraph):        # scan the arrays; no Edge handles needed
+    spans = ((g._offsets, g._targets), (g._in_offsets, g._in_targets))
+    adjacent = [lambda u, o=o, a=a: a[o[u]:o[u+1]] for o, a in spans]
+  else:
+    adjacent = [lambda u, out=out: (v for v, e in g.neighbors(u, out))
+                for out in (True, False)]
+  level = ({s: 0}, {t: 0})           # depth of vertices found by each search
+  parent = ({s: None}, {t: None})    # vertex from which each vertex was found
+  frontier = [[s], [t]]
+  meet = s if s == t else None
+  while meet is None and frontier[0] and frontier[1]:
+    side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+    mine, other = level[side], level[1 - side]
+    best = None                      # shortest path length through this level
+    next_level = []
+    for u in frontier[side]:
+      depth = mine[u] + 1
+      for v in adjacent[side](u):              # backward search uses incoming
+        if v not in mine:
+          mine[v] = depth
+          parent[side][v] = u
+          next_level.append(v)
+          if v in other and (best is None or depth + other[v] < best):
+            best, meet = depth + other[v], v
+    frontier[side] = next_level
+  if touched is not None:
+    touched.update(level[1])
+    touched.update(level[0])
+  if meet is None:
+    return None
+  path = [meet]
+  while parent[0][path[-1]] is not None:       # walk back to s
+    path.append(parent[0][path[-1]])
+  path.reverse()
+  while parent[1][path[-1]] is not None:       # walk ahead to t
+    path.append(parent[1][path[-1]])
+  return path
@@ -0,0 +1,150 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .partition import Partition, IndexedPartition
+
+def connected_components(g):
+  """Label the connected components of graph g.
+
+  Return a dictionary mapping each vertex to a component number between 0
+  and k-1, where k is the number of components. For a directed graph, edge
+  directions are ignored (giving weakly connected components).
+  """
+  verts = list(g.vertices())                 # make indexable list
+  index = {v: i for i, v in enumerate(verts)}
+  forest = IndexedPartition(len(verts))
+  for e in g.edges():
+    u, v = e.endpoints()
+    forest.union(index[u], index[v])
+  labels = forest.labels()
+  return {v: labels[i] for i, v in enumerate(verts)}
+
+class ComponentTracker:
+  """Connected components of a graph, maintained as vertices and edges arrive.
+
+  Vertices and edges are inserted through the tracker, which forwards them
+  to the underlying graph and merges the components of the endpoints in a
+  Partition. Queries then take near-constant amortized time, rather than
+  the full traversal that connected_components needs after each change.
+  As with connected_components, edge directions are ignored.
+
+  If the graph was created with log_changes=True, insertions made directly
+  on the graph are also picked up from its log before each query. Edge or
+  vertex removal is not supported: once one is logged, queries raise a
+  ValueError. For a graph that does not log, any modification other than
+  through the tracker requires creating a new tracker.
+  """
+
+  def __init__(self, g):
+    """Track the components of graph g, starting from its current contents."""
+    self._graph = g
+    self._forest = Partition()
+    self._position = {}                      # map vertex to its Position
+    try:
+      self._seen = len(g.changes())          # log entries already reflected
+    except (AttributeError, ValueError):     # graph does not log changes
+      self._seen = None
+    for v in g.vertices():
+      self._position[v] = self._forest.make_group(v)
+    for e in g.edges():
+      u, v = e.endpoints()
+      self._forest.union(self._position[u], self._position[v])
+
+  def _sync(self):
+    """Apply the changes logged by the graph since the tracker last looked.
+
+    Return the number of logged edges that joined two separate components.
+    """
+    merged = 0
+    if self._seen is not None:
+      for action, item in self._graph.changes(self._seen):
+        if action == 'insert_vertex':
+          self._position[item] = self._forest.make_group(item)
+        elif action == 'insert_edge':
+          u, v = item.endpoints()
+          if self._forest.union(self._position[u], self._position[v]):
+            merged += 1
+        else:                                # a component might have split
+          raise ValueError('components cannot be tracked after ' +
+                           action.replace('_', ' '))
+        self._seen += 1
+    return merged
+
+  def graph(self):
+    """Return the underlying graph."""
+    return self._graph
+
+  def insert_vertex(self, x=None):
+    """Insert and return a new vertex with element x, in a new component."""
+    v = self._graph.insert_vertex(x)
+    if self._seen is None:
+      self._position[v] = self._forest.make_group(v)
+    else:
+      self._sync()                           # the insertion is in the log
+    return v
+
+  def insert_edge(self, u, v, x=None):
+    """Insert and return a new edge from u to v with element x.
+
+    The components of u and v are merged. Errors are as for the graph's
+    insert_edge method.
+    """
+    e = self._graph.insert_edge(u, v, x)
+    if self._seen is None:
+      self._forest.union(self._position[u], self._position[v])
+    else:
+      self._sync()
+    return e
+
+  def insert_edges(self, triples):
+    """Insert an edge for each (u, v, x) triple; return the number merged.
+
+    This is the bulk path for a batch of edges; the result is the number of
+    edges that joined two previously separate components.
+    """
+    insert, union = self._graph.insert_edge, self._forest.union
+    if self._seen is not None:               # merge the batch from the log
+      self._sync()
+      for u, v, x in triples:
+        insert(u, v, x)
+      return self._sync()
+    position = self._position
+    merged = 0
+    for u, v, x in triples:
+      insert(u, v, x)
+      if union(position[u], position[v]):
+        merged += 1
+    return merged
+
+  def same_component(self, u, v):
+    """Return True if vertices u and v are in the same component."""
+    self._sync()
+    return self._forest.same_group(self._position[u], self._position[v])
+
+  def component_size(self, v):
+    """Return the number of vertices in the component containing v."""
+    self._sync()
+    return self._forest.group_size(self._position[v])
+
+  def component_count(self):
+    """Return the number of components."""
+    self._sync()
+    return self._forest.group_count()
@@ -0,0 +1,184 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+from contextlib import contextmanager
+from .graph import Graph
+from .csr_graph import CSRGraph
+
+class ReadWriteLock:
+  """Lock that admits many readers at once, or a single writer.
+
+  A waiting writer keeps new readers out, so that a steady stream of
+  queries cannot postpone an update forever. The lock is not reentrant.
+  """
+
+  def __init__(self):
+    self._cond = threading.Condition(threading.Lock())
+    self._readers = 0                   # number of threads holding read access
+    self._writing = False
+    self._waiting_writers = 0
+
+  def acquire_read(self):
+    with self._cond:
+      while self._writing or self._waiting_writers:
+        self._cond.wait()
+      self._readers += 1
+
+  def release_read(self):
+    with self._cond:
+      self._readers -= 1
+      if self._readers == 0:
+        self._cond.notify_all()         # a writer may be waiting
+
+  def acquire_write(self):
+    with self._cond:
+      self._waiting_writers += 1
+      while self._writing or self._readers:
+        self._cond.wait()
+      self._waiting_writers -= 1
+      self._writing = True
+
+  def release_write(self):
+    with self._cond:
+      self._writing = False
+      self._cond.notify_all()
+
+  @contextmanager
+  def read_locked(self):
+    """Context manager holding read access for the duration of a block."""
+    self.acquire_read()
+    try:
+      yield
+    finally:
+      self.release_read()
+
+  @contextmanager
+  def write_locked(self):
+    """Context manager holding write access for the duration of a block."""
+    self.acquire_write()
+    try:
+      yield
+    finally:
+      self.release_write()
+
+class ConcurrentGraph:
+  """Graph that may be shared by many reading threads and writing threads.
+
+  Each method runs under a ReadWriteLock, and methods that report several
+  vertices or edges return a list rather than an iteration, so a result is
+  never invalidated by a concurrent update. To run a whole algorithm on a
+  consistent state, either hold read access with
+
+    with cg.reading() as g:
+      BFS(g, s, discovered)
+
+  (updates wait until the block ends; inside it, use g rather than cg, as the
+  lock is not reentrant), or take a snapshot() and run it without any lock.
+  """
+
+  def __init__(self, directed=False):
+    """Create an empty graph (undirected, by default)."""
+    self._graph = Graph(directed)
+    self._lock = ReadWriteLock()
+
+  @contextmanager
+  def reading(self):
+    """Context manager providing the underlying Graph, with read access held."""
+    with self._lock.read_locked():
+      yield self._graph
+
+  def snapshot(self):
+    """Return a CSRGraph snapshot of the current state of the graph."""
+    with self._lock.read_locked():
+      return CSRGraph(self._graph)
+
+  #------------------------- read-only methods -------------------------
+  def is_directed(self):
+    """Return True if this is a directed graph; False if undirected."""
+    return self._graph.is_directed()
+
+  def vertex_count(self):
+    """Return the number of vertices in the graph."""
+    with self._lock.read_locked():
+      return self._graph.vertex_count()
+
+  def vertices(self):
+    """Return a list of all vertices of the graph."""
+    with self._lock.read_locked():
+      return list(self._graph.vertices())
+
+  def edge_count(self):
+    """Return the number of edges in the graph."""
+    with self._lock.read_locked():
+      return self._graph.edge_count()
+
+  def edges(self):
+    """Return a list of all edges of the graph."""
+    with self._lock.read_locked():
+      return list(self._graph.edges())
+
+  def get_edge(self, u, v):
+    """Return the edge from u to v, or None if not adjacent."""
+    with self._lock.read_locked():
+      return self._graph.get_edge(u, v)
+
+  def degree(self, v, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex v in the graph."""
+    with self._lock.read_locked():
+      return self._graph.degree(v, outgoing)
+
+  def incident_edges(self, v, outgoing=True):
+    """Return a list of the (outgoing) edges incident to vertex v."""
+    with self._lock.read_locked():
+      return list(self._graph.incident_edges(v, outgoing))
+
+  def neighbors(self, v, outgoing=True):
+    """Return a list of (u, e) pairs for the (outgoing) edges e=(v,u) at v."""
+    with self._lock.read_locked():
+      return list(self._graph.neighbors(v, outgoing))
+
+  #------------------------- update methods -------------------------
+  def insert_vertex(self, x=None):
+    """Insert and return a new Vertex with element x."""
+    with self._lock.write_locked():
+      return self._graph.insert_vertex(x)
+
+  def insert_edge(self, u, v, x=None):
+    """Insert and return a new Edge from u to v with auxiliary element x."""
+    with self._lock.write_locked():
+      return self._graph.insert_edge(u, v, x)
+
+  def insert_edges(self, triples):
+    """Insert an Edge for each (u, v, x) triple, holding write access once."""
+    with self._lock.write_locked():
+      for u, v, x in triples:
+        self._graph.insert_edge(u, v, x)
+
+  def remove_edge(self, e):
+    """Remove Edge e from the graph and return its element."""
+    with self._lock.write_locked():
+      return self._graph.remove_edge(e)
+
+  def remove_vertex(self, v):
+    """Remove Vertex v and all of its incident edges; return its element."""
+    with self._lock.write_locked():
+      return self._graph.remove_vertex(v)
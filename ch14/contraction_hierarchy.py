@@ -0,0 +1,312 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Binary file layout (all integers are 64-bit in native byte order):
+#
+#   header    magic, version, flags, n, upward slots, downward slots
+#   upward    n+1 offsets, then slots targets, weights and middle vertices
+#   downward  the same four arrays (directed graphs only)
+
+from array import array
+from bisect import bisect_left
+from heapq import heappush, heappop
+from .graph_store import _BinaryFormat
+
+MAGIC = b'DSAPCHIE'
+VERSION = 1
+
+_DIRECTED = 1                           # flag bits
+_FLOAT_WEIGHTS = 2
+_BIG_ENDIAN = 4
+
+_FORMAT = _BinaryFormat('contraction hierarchy', MAGIC, VERSION, '=8sIIqqq',
+                        _BIG_ENDIAN)
+
+_WITNESS_SETTLED = 60                   # vertices settled per witness search
+
+def _witness_distances(out, u, skip, limit):
+  """Return distances from u found by a small Dijkstra search that avoids skip.
+
+  The search over adjacency maps out stops at distance limit or after settling
+  _WITNESS_SETTLED vertices, so a reported distance may be too large (leading
+  only to an unnecessary shortcut), but never too small.
+  """
+  d = {u: 0}
+  settled = set()
+  heap = [(0, u)]
+  while heap and len(settled) < _WITNESS_SETTLED:
+    key, x = heappop(heap)
+    if x in settled:
+      continue
+    if key > limit:
+      break
+    settled.add(x)
+    for y, (wgt, middle) in out[x].items():
+      if y != skip:
+        dist = key + wgt
+        if y not in d or dist < d[y]:
+          d[y] = dist
+          heappush(heap, (dist, y))
+  return d
+
+class ContractionHierarchy:
+  """Contraction hierarchy of a static weighted graph, for exact point queries.
+
+  Preprocessing contracts the vertices one at a time, in an order chosen
+  by edge difference, adding a shortcut edge wherever contracting a vertex
+  would remove the only shortest path between two of its neighbors.  Each
+  vertex keeps its upward edges (to vertices contracted later) and its
+  downward edges (from vertices contracted later), and a query is a pair of
+  Dijkstra searches that only climb the hierarchy, from the source along
+  upward edges and from the target backward along downward edges.
+
+  Edge elements must be nonnegative numbers.  When built from a Graph, the
+  queries take and return its vertices; after load_hierarchy, vertices are
+  the integers 0 to n-1, in the order of the original g.vertices().
+  """
+
+  def __init__(self, g):
+    """Preprocess weighted graph g (a Graph or CSRGraph).
+
+    Raise a ValueError if some edge has a negative weight.
+    """
+    verts = list(g.vertices())
+    index = {v: i for i, v in enumerate(verts)}
+    n = len(verts)
+    directed = g.is_directed()
+    # out[u][v] and inc[v][u] are (weight, middle) for the current edge (u,v),
+    # where middle is the contracted vertex of a shortcut, or -1
+    out = [{} for i in range(n)]
+    inc = [{} for i in range(n)] if directed else out
+    for e in g.edges():
+      u, v = e.endpoints()
+      i, j = index[u], index[v]
+      wgt = e.element()
+      if wgt < 0:
+        raise ValueError('edge weights must be nonnegative')
+      if i != j and (j not in out[i] or wgt < out[i][j][0]):
+        out[i][j] = inc[j][i] = (wgt, -1)
+
+    up = [None] * n                     # final upward edges of each vertex
+    down = [None] * n if directed else up
+    removed = [0] * n                   # contracted neighbors of each vertex
+    heap = [(self._simulate(out, inc, v, directed, removed)[0], v)
+            for v in range(n)]
+    heap.sort()                         # a sorted list is a valid heap
+    while heap:
+      v = heappop(heap)[1]
+      priority, shortcuts = self._simulate(out, inc, v, directed, removed)
+      if heap and priority > heap[0][0]:
+        heappush(heap, (priority, v))   # lazy update: v is no longer minimal
+        continue
+      for u, x, wgt in shortcuts:
+        if x not in out[u] or wgt < out[u][x][0]:
+          out[u][x] = inc[x][u] = (wgt, v)
+      up[v] = out[v]
+      down[v] = inc[v]
+      for x in out[v]:
+        del inc[x][v]
+        removed[x] += 1
+      if directed:
+        for u in inc[v]:
+          del out[u][v]
+          removed[u] += 1
+
+    self._directed = directed
+    self._verts = verts
+    self._index = index
+    self._up = self._arrays(up)
+    self._down = self._arrays(down) if directed else self._up
+
+  @staticmethod
+  def _simulate(out, inc, v, directed, removed):
+    """Return (priority, shortcuts) for contracting v in the current graph.
+
+    shortcuts is a list of (u, x, weight) triples for the edges to add, and
+    the priority is the edge difference plus the number of contracted
+    neighbors of v (which spreads contraction evenly over the graph).
+    """
+    shortcuts = []
+    for u, (wgt_in, middle) in inc[v].items():
+      targets = [(x, wgt_in + wgt_out)
+                 for x, (wgt_out, middle) in out[v].items()
+                 if x != u and (directed or u < x)]
+      if targets:
+        limit = max(wgt for x, wgt in targets)
+        d = _witness_distances(out, u, v, limit)
+        for x, wgt in targets:
+          if x not in d or d[x] > wgt:  # no path as short that avoids v
+            shortcuts.append((u, x, wgt))
+    degree = len(out[v]) + (len(inc[v]) if directed else 0)
+    return len(shortcuts) - degree + removed[v], shortcuts
+
+  @staticmethod
+  def _arrays(rows):
+    """Return (offsets, targets, weights, middles) arrays for adjacency maps."""
+    offsets = array('q', [0])
+    targets, weights, middles = array('q'), [], array('q')
+    for row in rows:
+      for x in sorted(row):
+        wgt, middle = row[x]
+        targets.append(x)
+        weights.append(wgt)
+        middles.append(middle)
+      offsets.append(len(targets))
+    if all(type(w) is int for w in weights):
+      weights = array('q', weights)
+    else:
+      weights = array('d', weights)
+    return offsets, targets, weights, middles
+
+  @classmethod
+  def _from_arrays(cls, directed, n, up, down):
+    """Return a hierarchy built from existing arrays (see load_hierarchy)."""
+    ch = cls.__new__(cls)
+    ch._directed = directed
+    ch._verts = range(n)
+    ch._index = None                    # vertices are the integer ids
+    ch._up = up
+    ch._down = down if directed else up
+    return ch
+
+  def _id(self, v):
+    return v if self._index is None else self._index[v]
+
+  def shortcut_count(self):
+    """Return the number of shortcut edges added by preprocessing."""
+    total = sum(1 for m in self._up[3] if m >= 0)
+    if self._directed:
+      total += sum(1 for m in self._down[3] if m >= 0)
+    return total
+
+  def _search(self, s, t):
+    """Return (distance, meet, forward parents, backward parents) for s to t.
+
+    meet is the highest vertex of a shortest path, or None if t is unreachable.
+    """
+    graphs = (self._up, self._down)
+    dist = ({s: 0}, {t: 0})
+    parent = ({s: None}, {t: None})
+    settled = (set(), set())
+    heaps = ([(0, s)], [(0, t)])
+    best, meet = float('inf'), None
+    side = 0
+    while heaps[0] or heaps[1]:
+      if not heaps[side]:
+        side = 1 - side
+      key, u = heappop(heaps[side])
+      if key >= best:                   # this direction cannot improve best
+        heaps[side].clear()
+        side = 1 - side
+        continue
+      if u not in settled[side]:
+        settled[side].add(u)
+        other = dist[1 - side].get(u)
+        if other is not None and key + other < best:
+          best, meet = key + other, u
+        offsets, targets, weights, middles = graphs[side]
+        for k in range(offsets[u], offsets[u+1]):
+          v = targets[k]
+          alt = key + weights[k]
+          if v not in dist[side] or alt < dist[side][v]:
+            dist[side][v] = alt
+            parent[side][v] = u
+            heappush(heaps[side], (alt, v))
+      side = 1 - side                   # alternate between the two searches
+    return best, meet, parent[0], parent[1]
+
+  def distance(self, u, v):
+    """Return the shortest-path distance from u to v, or None if unreachable."""
+    best, meet, forward, backward = self._search(self._id(u), self._id(v))
+    return best if meet is not None else None
+
+  def _middle(self, a, b):
+    """Return the middle vertex of hierarchy edge (a,b), or -1 if original."""
+    offsets, targets, weights, middles = self._up
+    lo, hi = offsets[a], offsets[a+1]
+    k = bisect_left(targets, b, lo, hi)
+    if k < hi and targets[k] == b:      # a is below b: upward edge of a
+      return middles[k]
+    offsets, targets, weights, middles = self._down
+    lo, hi = offsets[b], offsets[b+1]
+    return middles[bisect_left(targets, a, lo, hi)]
+
+  def _unpack(self, a, b, path):
+    """Append the original vertices after a on hierarchy edge (a,b) to path."""
+    stack = [(a, b)]
+    while stack:
+      a, b = stack.pop()
+      m = self._middle(a, b)
+      if m < 0:
+        path.append(b)
+      else:                             # shortcut (a,b) stands for (a,m),(m,b)
+        stack.append((m, b))
+        stack.append((a, m))
+
+  def path(self, u, v):
+    """
+    Return a list of vertices comprising a shortest path from u to v,
+    or None if v is not reachable from u.
+    """
+    best, meet, forward, backward = self._search(self._id(u), self._id(v))
+    if meet is None:
+      return None
+    climb = [meet]
+    while forward[climb[-1]] is not None:
+      climb.append(forward[climb[-1]])
+    climb.reverse()                     # hierarchy vertices from u up to meet
+    x = meet
+    while backward[x] is not None:
+      climb.append(backward[x])
+      x = backward[x]
+    path = [climb[0]]
+    for k in range(1, len(climb)):
+      self._unpack(climb[k-1], climb[k], path)
+    return [self._verts[i] for i in path]
+
+def save_hierarchy(ch, path):
+  """Write ContractionHierarchy ch to the named file in binary form."""
+  flags = _DIRECTED if ch._directed else 0
+  if memoryview(ch._up[2]).format == 'd':   # an array, or a loaded view
+    flags |= _FLOAT_WEIGHTS
+  arrays = list(ch._up)
+  if ch._directed:
+    arrays.extend(ch._down)
+  down_slots = len(ch._down[1]) if ch._directed else 0
+  _FORMAT.save(path, flags, (len(ch._up[0]) - 1, len(ch._up[1]), down_slots),
+               arrays)
+
+def load_hierarchy(path):
+  """Return the ContractionHierarchy stored in the named file.
+
+  The file is memory-mapped and its arrays are used in place, so loading
+  takes time independent of the size of the hierarchy.  Vertices of the
+  result are the integers 0 to n-1.
+  """
+  _, (flags, n, up_slots, down_slots), take = _FORMAT.load(path)
+  weight_code = 'd' if flags & _FLOAT_WEIGHTS else 'q'
+
+  def graph(slots):
+    return (take(n + 1), take(slots), take(slots, weight_code), take(slots))
+
+  up = graph(up_slots)
+  down = graph(down_slots) if flags & _DIRECTED else None
+  return ContractionHierarchy._from_arrays(bool(flags & _DIRECTED), n, up, down)
@@ -0,0 +1,297 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from bisect import bisect_left
+from .graph import Graph
+
+def _weight_array(elements):
+  """Return a compact container for a list of edge elements.
+
+  Integer weights are stored in a signed 64-bit array, other numeric weights
+  in a double array; arbitrary elements are kept in the original list.
+  """
+  if all(type(x) is int for x in elements):
+    try:
+      return array('q', elements)
+    except OverflowError:               # too large for a machine word
+      return elements
+  if all(type(x) in (int, float) for x in elements):
+    return array('d', elements)
+  return elements
+
+class CSRGraph:
+  """Immutable, array-backed snapshot of a Graph in compressed sparse row form.
+
+  Vertices are the integers 0 to n-1.  The outgoing edges of vertex u occupy
+  slots offsets[u] to offsets[u+1]-1 of the parallel targets and weights arrays,
+  sorted by target.  An undirected edge occupies one slot in each direction.
+
+  The class supports the read-only portion of the Graph interface, so that
+  the algorithms of this chapter run directly on a snapshot.  Edge handles are
+  created on demand by neighbors and incident_edges; breadth-first search and
+  the Dijkstra variants read the arrays directly (see adjacency) and allocate
+  no handle per edge examined, while other algorithms still pay that cost.
+  """
+
+  _path = None                 # file mapped by graph_store.load_graph, if any
+
+  #------------------------- nested Edge class -------------------------
+  class Edge:
+    """Lightweight handle for an edge of a CSRGraph, created on demand."""
+    __slots__ = '_graph', '_origin', '_destination', '_slot'
+
+    def __init__(self, graph, u, v, slot):
+      """Do not call constructor directly. Edges are reported by CSRGraph."""
+      self._graph = graph
+      self._origin = u
+      self._destination = v
+      self._slot = slot                 # index into graph's outgoing arrays
+
+    def endpoints(self):
+      """Return (u,v) tuple for vertices u and v."""
+      return (self._origin, self._destination)
+
+    def opposite(self, v):
+      """Return the vertex that is opposite v on this edge."""
+      return self._destination if v == self._origin else self._origin
+
+    def element(self):
+      """Return element associated with this edge."""
+      return self._graph._weights[self._slot]
+
+    def _key(self):
+      u, v = self._origin, self._destination
+      if not self._graph._directed and v < u:
+        u, v = v, u                     # undirected edge has one identity
+      return (u, v)
+
+    def __eq__(self, other):
+      return (isinstance(other, CSRGraph.Edge) and
+              self._graph is other._graph and self._key() == other._key())
+
+    def __hash__(self):                 # will allow edge to be a map/set key
+      return hash(self._key())
+
+    def __str__(self):
+      return '({0},{1},{2})'.format(self._origin, self._destination,
+                                    self.element())
+
+  #------------------------- CSRGraph methods -------------------------
+  def __init__(self, g):
+    """Create a CSR snapshot of Graph g.
+
+    Later changes to g are not reflected in the snapshot.
+    """
+    verts = list(g.vertices())
+    index = {}                                   # map Vertex to integer id
+    for i, v in enumerate(verts):
+      index[v] = i
+    self._directed = g.is_directed()
+    self._elements = [v.element() for v in verts]
+    self._index = index
+
+    out_map = g._outgoing
+    self._offsets, self._targets, elements = self._build(verts, out_map, index)
+    self._weights = _weight_array(elements)
+    if self._directed:
+      self._in_offsets, self._in_targets, self._in_slots = self._build_incoming()
+    else:                                        # incoming edges are outgoing
+      self._in_offsets, self._in_targets, self._in_slots = (
+        self._offsets, self._targets, None)
+
+  @classmethod
+  def _from_arrays(cls, directed, elements, offsets, targets, weights,
+                   in_offsets=None, in_targets=None, in_slots=None):
+    """Return a CSRGraph assembled from existing arrays (not from a Graph).
+
+    The arrays may be any sequences of integers, such as memoryviews of a
+    memory-mapped file; incoming arrays are required if directed is True.
+    """
+    csr = cls.__new__(cls)
+    csr._directed = directed
+    csr._elements = elements
+    csr._index = None                            # no original Vertex objects
+    csr._offsets, csr._targets, csr._weights = offsets, targets, weights
+    if directed:
+      csr._in_offsets, csr._in_targets, csr._in_slots = (
+        in_offsets, in_targets, in_slots)
+    else:
+      csr._in_offsets, csr._in_targets, csr._in_slots = offsets, targets, None
+    return csr
+
+  @staticmethod
+  def _build(verts, adj_map, index):
+    """Return (offsets, targets, elements) for the adjacency maps of verts."""
+    offsets = array('q', [0])
+    targets = array('q')
+    elements = []
+    for v in verts:
+      row = sorted((index[w], e.element()) for w, e in adj_map[v].items())
+      for t, x in row:
+        targets.append(t)
+        elements.append(x)
+      offsets.append(len(targets))
+    return offsets, targets, elements
+
+  def _build_incoming(self):
+    """Return (offsets, targets, slots) describing incoming edges.
+
+    The slots array maps each incoming entry to the outgoing slot of that edge.
+    """
+    n = len(self._elements)
+    counts = [0] * (n + 1)
+    for t in self._targets:
+      counts[t+1] += 1
+    for i in range(n):
+      counts[i+1] += counts[i]                   # prefix sums become offsets
+    offsets = array('q', counts)
+    fill = counts[:n]                            # next free position per row
+    targets = array('q', bytes(8 * len(self._targets)))
+    slots = array('q', bytes(8 * len(self._targets)))
+    for u in range(n):                           # ascending u keeps rows sorted
+      for k in range(self._offsets[u], self._offsets[u+1]):
+        v = self._targets[k]
+        targets[fill[v]] = u
+        slots[fill[v]] = k
+        fill[v] += 1
+    return offsets, targets, slots
+
+  def vertex_id(self, v):
+    """Return the integer id of Vertex v from the original graph."""
+    if self._index is None:
+      raise ValueError('snapshot was not built from a Graph')
+    return self._index[v]
+
+  def element(self, u):
+    """Return element associated with vertex u."""
+    return self._elements[u]
+
+  def is_directed(self):
+    """Return True if this is a directed graph; False if undirected."""
+    return self._directed
+
+  def vertex_count(self):
+    """Return the number of vertices in the graph."""
+    return len(self._offsets) - 1
+
+  def vertices(self):
+    """Return an iteration of all vertices of the graph."""
+    return range(self.vertex_count())
+
+  def edge_count(self):
+    """Return the number of edges in the graph."""
+    total = len(self._targets)
+    return total if self._directed else total // 2
+
+  def edges(self):
+    """Generate each edge of the graph exactly once."""
+    offsets, targets = self._offsets, self._targets
+    for u in range(self.vertex_count()):
+      for k in range(offsets[u], offsets[u+1]):
+        v = targets[k]
+        if self._directed or u <= v:             # report undirected edge once
+          yield self.Edge(self, u, v, k)
+
+  def _validate_vertex(self, u):
+    """Verify that u is a vertex (an integer from 0 to n-1) of this graph."""
+    if not isinstance(u, int):
+      raise TypeError('Vertex expected')
+    if not 0 <= u < self.vertex_count():
+      raise ValueError('Vertex does not belong to this graph.')
+
+  def get_edge(self, u, v):
+    """Return the edge from u to v, or None if not adjacent."""
+    self._validate_vertex(u)
+    self._validate_vertex(v)
+    lo, hi = self._offsets[u], self._offsets[u+1]
+    k = bisect_left(self._targets, v, lo, hi)
+    if k < hi and self._targets[k] == v:
+      return self.Edge(self, u, v, k)
+    return None
+
+  def degree(self, u, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex u in the graph.
+
+    If graph is directed, optional parameter used to count incoming edges.
+    """
+    self._validate_vertex(u)
+    offsets = self._offsets if outgoing else self._in_offsets
+    return offsets[u+1] - offsets[u]
+
+  def incident_edges(self, u, outgoing=True):
+    """Return all (outgoing) edges incident to vertex u in the graph.
+
+    If graph is directed, optional parameter used to request incoming edges.
+    """
+    self._validate_vertex(u)
+    if outgoing or not self._directed:
+      targets = self._targets
+      for k in range(self._offsets[u], self._offsets[u+1]):
+        yield self.Edge(self, u, targets[k], k)
+    else:
+      targets, slots = self._in_targets, self._in_slots
+      for k in range(self._in_offsets[u], self._in_offsets[u+1]):
+        yield self.Edge(self, targets[k], u, slots[k])
+
+  def to_graph(self):
+    """Return a new Graph with the vertices and edges of this snapshot.
+
+    Vertex i of the snapshot becomes the i-th vertex inserted in the result.
+    """
+    g = Graph(self._directed)
+    verts = [g.insert_vertex(self._elements[u]) for u in self.vertices()]
+    for e in self.edges():
+      u, v = e.endpoints()
+      g.insert_edge(verts[u], verts[v], e.element())
+    return g
+
+  def neighbors(self, u, outgoing=True):
+    """Generate (v, e) pairs for the (outgoing) edges e incident to u.
+
+    If graph is directed, optional parameter used to request incoming edges.
+    This matches the unchecked Graph.neighbors interface.
+    """
+    Edge = self.Edge
+    if outgoing or not self._directed:
+      targets = self._targets
+      for k in range(self._offsets[u], self._offsets[u+1]):
+        v = targets[k]
+        yield v, Edge(self, u, v, k)
+    else:
+      targets, slots = self._in_targets, self._in_slots
+      for k in range(self._in_offsets[u], self._in_offsets[u+1]):
+        v = targets[k]
+        yield v, Edge(self, v, u, slots[k])
+
+  def adjacency(self, u, outgoing=True):
+    """Return (neighbors, weights) sequences for the edges incident to u.
+
+    This is a fast path for loops that need no Edge handles.  For incoming
+    edges of a directed graph the weights are gathered into a new list.
+    """
+    if outgoing or not self._directed:
+      lo, hi = self._offsets[u], self._offsets[u+1]
+      return self._targets[lo:hi], self._weights[lo:hi]
+    lo, hi = self._in_offsets[u], self._in_offsets[u+1]
+    weights = self._weights
+    return (self._in_targets[lo:hi],
+            [weights[k] for k in self._in_slots[lo:hi]])
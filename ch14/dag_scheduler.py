@@ -0,0 +1,64 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .topological_sort import topological_layers
+
+def execute_dag(g, task, executor=None):
+  """Run task on the element of every vertex of directed acyclic graph g.
+
+  Each edge (u,v) is a dependency: task for v starts only after the task for
+  u has finished. A vertex is submitted to the executor as soon as its last
+  dependency completes, so independent work runs concurrently. executor may
+  be any concurrent.futures executor (a thread pool is used by default); for
+  a process pool, task and the vertex elements must be picklable.
+
+  Return a dictionary mapping each vertex to the result of its task. Raise
+  CycleError before running anything if g has a cycle; if a task raises an
+  exception, no further tasks are started and the exception is re-raised.
+  """
+  topological_layers(g)                  # raises CycleError if g is cyclic
+  own_executor = executor is None
+  if own_executor:
+    executor = ThreadPoolExecutor()
+  results = {}
+  incount = {}
+  running = {}                           # map from future to its vertex
+  try:
+    for u in g.vertices():
+      incount[u] = g.degree(u, False)
+      if incount[u] == 0:
+        running[executor.submit(task, u.element())] = u
+    while running:
+      done, pending = wait(running, return_when=FIRST_COMPLETED)
+      for future in done:
+        u = running.pop(future)
+        results[u] = future.result()     # re-raises a failure of the task
+        for v, e in g.neighbors(u):
+          incount[v] -= 1
+          if incount[v] == 0:            # all dependencies of v are done
+            running[executor.submit(task, v.element())] = v
+  finally:
+    for future in running:
+      future.cancel()
+    if own_executor:
+      executor.shutdown()
+  return results
@@ -0,0 +1,134 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+try:
+  import numpy as np
+except ImportError:                     # NumPy is needed only for this module
+  np = None
+
+_BLOCK = 64                              # rows per vectorized update
+
+class DenseGraph:
+  """Adjacency-matrix representation of a weighted graph, using NumPy.
+
+  Entry [i,j] of the matrix is the weight of the edge from the i-th vertex
+  to the j-th vertex, infinity if there is no such edge, and 0 if i == j.
+  """
+
+  def __init__(self, g):
+    """Create the adjacency matrix of Graph g, with edge elements as weights."""
+    if np is None:
+      raise ImportError('DenseGraph requires NumPy')
+    self._verts = list(g.vertices())          # make indexable list
+    self._index = {v: i for i, v in enumerate(self._verts)}
+    n = len(self._verts)
+    self._matrix = np.full((n, n), np.inf)
+    np.fill_diagonal(self._matrix, 0)
+    for e in g.edges():
+      u, v = e.endpoints()
+      i, j = self._index[u], self._index[v]
+      self._matrix[i, j] = min(self._matrix[i, j], e.element())
+      if not g.is_directed():
+        self._matrix[j, i] = self._matrix[i, j]
+
+  def vertices(self):
+    """Return a list of the vertices, in matrix order."""
+    return list(self._verts)
+
+  def index(self, v):
+    """Return the row (and column) of the matrix that represents vertex v."""
+    return self._index[v]
+
+  def matrix(self):
+    """Return the adjacency matrix (a NumPy array, not to be modified)."""
+    return self._matrix
+
+  def all_pairs_shortest_paths(self):
+    """Compute shortest paths between all pairs of vertices by Floyd-Warshall.
+
+    Each of the n rounds updates the distance and predecessor matrices with
+    vectorized min-plus steps through the next pivot vertex. Return an
+    AllPairsShortestPaths instance. Raise a ValueError if the graph has a
+    negative-weight cycle.
+    """
+    n = len(self._verts)
+    dist = self._matrix.copy()
+    # pred[i,j] is the vertex preceding j on the best known path from i to j
+    pred = np.where(np.isfinite(dist), np.arange(n, dtype=np.int32)[:, None],
+                    np.int32(-1)).astype(np.int32)
+    np.fill_diagonal(pred, -1)
+    through_k = np.empty((_BLOCK, n))         # buffers reused in every round
+    better = np.empty((_BLOCK, n), dtype=bool)
+    for k in range(n):
+      dist_k, pred_k = dist[k].copy(), pred[k].copy()
+      # rows are processed in blocks small enough to stay in the CPU cache
+      for start in range(0, n, _BLOCK):
+        stop = min(start + _BLOCK, n)
+        rows = dist[start:stop]
+        step, mask = through_k[:stop-start], better[:stop-start]
+        np.add(rows[:, k, None], dist_k, out=step)      # paths i -> k -> j
+        np.less(step, rows, out=mask)
+        np.minimum(rows, step, out=rows)
+        np.copyto(pred[start:stop], pred_k, where=mask)
+    if (np.diagonal(dist) < 0).any():
+      raise ValueError('graph has a negative-weight cycle')
+    return AllPairsShortestPaths(self._verts, self._index, dist, pred)
+
+class AllPairsShortestPaths:
+  """Distance and predecessor matrices for all pairs of vertices of a graph."""
+
+  def __init__(self, verts, index, dist, pred):
+    """Do not call constructor directly. Use all_pairs_shortest_paths(g)."""
+    self._verts = verts
+    self._index = index
+    self._dist = dist
+    self._pred = pred
+
+  def distance(self, u, v):
+    """Return the shortest-path distance from u to v (inf if not reachable)."""
+    return float(self._dist[self._index[u], self._index[v]])
+
+  def distances(self):
+    """Return the matrix of shortest-path distances (a NumPy array)."""
+    return self._dist
+
+  def predecessors(self):
+    """Return the matrix of predecessor indices (-1 where there is none)."""
+    return self._pred
+
+  def path(self, u, v):
+    """
+    Return a list of vertices comprising a shortest path from u to v,
+    or an empty list if v is not reachable from u.
+    """
+    i, j = self._index[u], self._index[v]
+    if not np.isfinite(self._dist[i, j]):
+      return []
+    path = [j]
+    while j != i:
+      j = int(self._pred[i, j])
+      path.append(j)
+    path.reverse()
+    return [self._verts[k] for k in path]
+
+def all_pairs_shortest_paths(g):
+  """Return an AllPairsShortestPaths instance for weighted graph g."""
+  return DenseGraph(g).all_pairs_shortest_paths()
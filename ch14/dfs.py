@@ -19,18 +19,59 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-def DFS(g, u, discovered):
+def DFS(g, u, discovered, discover=None, finish=None, tree_edge=None,
+        back_edge=None, forward_edge=None, cross_edge=None):
   """Perform DFS of the undiscovered portion of Graph g starting at Vertex u.
 
   discovered is a dictionary mapping each vertex to the edge that was used to
   discover it during the DFS. (u should be "discovered" prior to the call.)
   Newly discovered vertices will be added to the dictionary as a result.
+
+  The search uses an explicit stack, so the depth of the graph is not limited
+  by Python's recursion limit.  Each optional callback is invoked as the
+  corresponding event occurs: discover(v) and finish(v) for vertices, and
+  tree_edge(e), back_edge(e), forward_edge(e) and cross_edge(e) for edges.
+  For an undirected graph, each nontree edge is reported once as a back edge.
   """
-  for e in g.incident_edges(u):    # for every outgoing edge from u
-    v = e.opposite(u)
-    if v not in discovered:        # v is an unvisited vertex
-      discovered[v] = e            # e is the tree edge that discovered v
-      DFS(g, v, discovered)        # recursively explore from v
+  classify = (back_edge is not None or forward_edge is not None
+              or cross_edge is not None)
+  directed = g.is_directed()
+  order = {u: 0}                   # discovery order of vertices on this search
+  active = {u}                     # vertices whose exploration is unfinished
+  if discover is not None:
+    discover(u)
+  stack = [(u, iter(g.neighbors(u)))]
+  while stack:
+    u, edges = stack[-1]
+    for v, e in edges:             # resume scan of u's outgoing edges
+      if v not in discovered:      # v is an unvisited vertex
+        discovered[v] = e          # e is the tree edge that discovered v
+        if tree_edge is not None:
+          tree_edge(e)
+        if discover is not None:
+          discover(v)
+        if classify:
+          order[v] = len(order)
+          active.add(v)
+        stack.append((v, iter(g.neighbors(v))))
+        break                      # continue exploring from v
+      elif classify:
+        if v in active:
+          if directed or e != discovered[u]:   # skip edge back to parent
+            if back_edge is not None:
+              back_edge(e)
+        elif directed:             # v is finished
+          if order.get(v, -1) > order[u]:
+            if forward_edge is not None:
+              forward_edge(e)      # v is a descendant of u
+          elif cross_edge is not None:
+            cross_edge(e)
+    else:                          # all edges of u have been explored
+      stack.pop()
+      if classify:
+        active.discard(u)
+      if finish is not None:
+        finish(u)
 
 def construct_path(u, v, discovered):
   """
@@ -44,7 +85,7 @@ def construct_path(u, v, discovered):
     # we build list from v to u and then reverse it at the end
     path.append(v)
     walk = v
-    while walk is not u:
+    while walk != u:
       e = discovered[walk]         # find edge leading to walk
       parent = e.opposite(walk)
       path.append(parent)
@@ -52,15 +93,18 @@ def construct_path(u, v, discovered):
     path.reverse()                 # reorient path from u to v
   return path
 
-def DFS_complete(g):
+def DFS_complete(g, discover=None, finish=None, tree_edge=None,
+                 back_edge=None, forward_edge=None, cross_edge=None):
   """Perform DFS for entire graph and return forest as a dictionary.
 
   Result maps each vertex v to the edge that was used to discover it.
   (Vertices that are roots of a DFS tree are mapped to None.)
+  Optional callbacks are passed to each call of DFS.
   """
   forest = {}
   for u in g.vertices():
     if u not in forest:
       forest[u] = None             # u will be the root of a tree
-      DFS(g, u, forest)
+      DFS(g, u, forest, discover, finish, tree_edge,
+          back_edge, forward_edge, cross_edge)
   return forest
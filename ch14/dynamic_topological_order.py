@@ -0,0 +1,119 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .topological_sort import topological_layers, CycleError
+
+class DynamicTopologicalOrder:
+  """Topological order of a directed acyclic graph, maintained under insertion.
+
+  Edges must be inserted through this structure rather than the graph itself.
+  Following Pearce and Kelly, an insertion that violates the current order
+  only reorders the vertices whose positions lie between the two endpoints
+  and that are connected to them, rather than sorting the whole graph again.
+  """
+
+  def __init__(self, g):
+    """Maintain a topological order of directed acyclic graph g.
+
+    Raise CycleError if g has a cycle.
+    """
+    self._graph = g
+    self._order = {}                     # map vertex to its position
+    self._vertices = []                  # vertex at each position
+    for layer in topological_layers(g):
+      for v in layer:
+        self._order[v] = len(self._vertices)
+        self._vertices.append(v)
+
+  def graph(self):
+    """Return the underlying graph."""
+    return self._graph
+
+  def order(self):
+    """Return a list of all vertices in topological order."""
+    return list(self._vertices)
+
+  def position(self, v):
+    """Return the position of vertex v in the topological order."""
+    return self._order[v]
+
+  def insert_vertex(self, x=None):
+    """Insert and return a new Vertex with element x, placed last in order."""
+    v = self._graph.insert_vertex(x)
+    self._order[v] = len(self._vertices)
+    self._vertices.append(v)
+    return v
+
+  def insert_edge(self, u, v, x=None):
+    """Insert and return a new Edge from u to v with auxiliary element x.
+
+    Raise CycleError, leaving the graph unchanged, if the edge would create
+    a cycle; the error lists the vertices of that cycle. Raise a ValueError
+    if u and v are already adjacent.
+    """
+    if self._graph.get_edge(u, v) is not None:   # includes error checking
+      raise ValueError('u and v are already adjacent')
+    lower, upper = self._order[v], self._order[u]
+    if lower <= upper:                   # edge violates the current order
+      forward = self._search(v, u, upper, True)
+      backward = self._search(u, None, lower, False)
+      self._reorder(backward, forward)
+    return self._graph.insert_edge(u, v, x)
+
+  def _search(self, start, target, bound, forward):
+    """Return vertices reachable from start within the affected region.
+
+    A forward search follows outgoing edges to vertices at positions up to
+    bound and raises CycleError if it reaches target; a backward search
+    follows incoming edges to vertices at positions of at least bound.
+    """
+    order = self._order
+    parent = {start: None}
+    stack = [start]
+    while stack:
+      w = stack.pop()
+      if w == target:                    # new edge would close a cycle
+        cycle = []
+        while w is not None:
+          cycle.append(w)
+          w = parent[w]
+        cycle.reverse()
+        raise CycleError(cycle)
+      for z, e in self._graph.neighbors(w, forward):
+        if z not in parent:
+          if (order[z] <= bound) if forward else (order[z] >= bound):
+            parent[z] = w
+            stack.append(z)
+    return list(parent)
+
+  def _reorder(self, backward, forward):
+    """Move the backward vertices ahead of the forward ones.
+
+    The two groups keep their internal order and together reuse the
+    positions that they occupied before.
+    """
+    order = self._order
+    backward.sort(key=order.get)
+    forward.sort(key=order.get)
+    slots = sorted(order[w] for w in backward + forward)
+    for i, w in enumerate(backward + forward):
+      order[w] = slots[i]
+      self._vertices[slots[i]] = w
@@ -0,0 +1,107 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compare Dijkstra's algorithm with a binary heap against a bucket queue
+# on graphs with small and large integer weights, and report which of the
+# two shortest_path_lengths picks (auto).
+# Run as a module, e.g.:  python -m package.ch14.experiment_buckets 300
+
+import sys
+from math import hypot
+from random import Random
+from time import time
+from .graph import Graph
+from .shortest_paths import heap_shortest_path_lengths
+from .shortest_paths import bucket_shortest_path_lengths
+from .shortest_paths import shortest_path_lengths
+
+try:
+  side = int(sys.argv[1])
+except:
+  side = 300
+
+def grid_graph(side, max_weight=9, seed=0):
+  """Return a side-by-side grid graph with random weights 1 to max_weight."""
+  rand = Random(seed)
+  g = Graph()
+  verts = [[g.insert_vertex((r, c)) for c in range(side)] for r in range(side)]
+  for r in range(side):
+    for c in range(side):
+      if c + 1 < side:
+        g.insert_edge(verts[r][c], verts[r][c+1], rand.randint(1, max_weight))
+      if r + 1 < side:
+        g.insert_edge(verts[r][c], verts[r+1][c], rand.randint(1, max_weight))
+  return g
+
+def road_graph(side, scale=10, seed=0):
+  """Return a road-like graph on side*side randomly placed intersections.
+
+  Points on a jittered grid are joined to their grid neighbors, with some
+  streets missing and some diagonal shortcuts; each weight is the rounded
+  length of the street times scale, so weights range up to about 3*scale.
+  """
+  rand = Random(seed)
+  g = Graph()
+  pts = [[(r + rand.uniform(-0.3, 0.3), c + rand.uniform(-0.3, 0.3))
+          for c in range(side)] for r in range(side)]
+  verts = [[g.insert_vertex(pts[r][c]) for c in range(side)]
+           for r in range(side)]
+  def street(r, c, r2, c2):
+    (y, x), (y2, x2) = pts[r][c], pts[r2][c2]
+    g.insert_edge(verts[r][c], verts[r2][c2],
+                  max(1, round(scale * hypot(y - y2, x - x2))))
+  for r in range(side):
+    for c in range(side):
+      if c + 1 < side and rand.random() < 0.9:
+        street(r, c, r, c+1)
+      if r + 1 < side and rand.random() < 0.9:
+        street(r, c, r+1, c)
+      if r + 1 < side and c + 1 < side and rand.random() < 0.1:
+        street(r, c, r+1, c+1)
+  return g
+
+def path_graph(n, weight):
+  """Return a path of n vertices whose edges all have the given weight."""
+  g = Graph()
+  verts = [g.insert_vertex(k) for k in range(n)]
+  for k in range(n - 1):
+    g.insert_edge(verts[k], verts[k+1], weight)
+  return g
+
+def timed(f, *args):
+  """Return (result, seconds elapsed) for a call f(*args)."""
+  start = time()
+  result = f(*args)
+  return result, time() - start
+
+print('{0:>12} {1:>10} {2:>12} {3:>12} {4:>12}'.format(
+  'graph', 'vertices', 'heap (s)', 'buckets (s)', 'auto (s)'))
+for name, g in (('grid', grid_graph(side)),
+                ('road', road_graph(side)),
+                ('road metres', road_graph(side, scale=1000)),
+                ('path 60000', path_graph(1000, 60000))):
+  src = next(iter(g.vertices()))
+  heap, heap_time = timed(heap_shortest_path_lengths, g, src)
+  bucket, bucket_time = timed(bucket_shortest_path_lengths, g, src)
+  auto, auto_time = timed(shortest_path_lengths, g, src)
+  assert heap == bucket == auto
+  print('{0:>12} {1:>10} {2:>12.3f} {3:>12.3f} {4:>12.3f}'.format(
+    name, g.vertex_count(), heap_time, bucket_time, auto_time))
@@ -0,0 +1,112 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Measure query throughput of a ConcurrentGraph while another thread inserts
+# edges, comparing locked traversals with traversals of snapshots.
+# Run as a module, e.g.:  python -m package.ch14.experiment_concurrent 4
+
+import sys
+import threading
+from random import Random
+from time import sleep
+from .concurrent_graph import ConcurrentGraph
+from .bfs import bidirectional_BFS
+
+try:
+  readers = int(sys.argv[1])
+except:
+  readers = 4
+
+N = 20000                                # vertices
+SECONDS = 3.0                            # duration of each trial
+BATCH = 100                              # edges per write
+
+def build(n, seed=0):
+  """Return a ConcurrentGraph with n vertices and 4n edges, and its vertices."""
+  rand = Random(seed)
+  cg = ConcurrentGraph()
+  verts = [cg.insert_vertex(k) for k in range(n)]
+  pairs = set()
+  while len(pairs) < 4 * n:
+    i, j = rand.randrange(n), rand.randrange(n)
+    if i < j:
+      pairs.add((i, j))
+  cg.insert_edges((verts[i], verts[j], None) for i, j in pairs)
+  return cg, verts
+
+def trial(cg, verts, seed, writing, snapshots):
+  """Return (queries, edges written) per second during one trial.
+
+  Snapshot readers each query a snapshot taken when the trial begins.
+  """
+  stop = threading.Event()
+  queries = [0] * readers
+  written = [0]
+
+  def reader(k):
+    rand = Random(seed + k)
+    snap = cg.snapshot() if snapshots else None
+    while not stop.is_set():
+      if snapshots:
+        s, t = rand.randrange(len(verts)), rand.randrange(len(verts))
+        bidirectional_BFS(snap, s, t)
+      else:
+        s, t = rand.choice(verts), rand.choice(verts)
+        with cg.reading() as g:
+          bidirectional_BFS(g, s, t)
+      queries[k] += 1
+
+  def writer():
+    rand = Random(seed + readers)        # differs from every reader's stream
+    while not stop.is_set():
+      batch = []
+      pairs = set()                      # pairs already in batch, both ways
+      for k in range(BATCH):
+        u, v = rand.choice(verts), rand.choice(verts)
+        if u is not v and (u, v) not in pairs and cg.get_edge(u, v) is None:
+          batch.append((u, v, None))
+          pairs.add((u, v))
+          pairs.add((v, u))             # the graph is undirected
+      cg.insert_edges(batch)
+      written[0] += len(batch)
+
+  threads = [threading.Thread(target=reader, args=(k,))
+             for k in range(readers)]
+  if writing:
+    threads.append(threading.Thread(target=writer))
+  for thread in threads:
+    thread.start()
+  sleep(SECONDS)
+  stop.set()
+  for thread in threads:
+    thread.join()
+  return sum(queries) / SECONDS, written[0] / SECONDS
+
+print('{0} reader threads, {1} vertices'.format(readers, N))
+print('{0:>28} {1:>12} {2:>12}'.format('', 'queries/s', 'edges/s'))
+for seed, (label, writing, snapshots) in enumerate((
+    ('locked, no writer', False, False),
+    ('locked, with writer', True, False),
+    ('snapshots, no writer', False, True),
+    ('snapshots, with writer', True, True))):
+  cg, verts = build(N)             # every trial starts from same graph
+  reads, writes = trial(cg, verts, seed, writing, snapshots)
+  print('{0:>28} {1:>12.0f} {2:>12.0f}'.format(label, reads, writes))
@@ -0,0 +1,77 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compare memory and traversal time of a Graph against its CSRGraph snapshot.
+# Run as a module, e.g.:  python -m package.ch14.experiment_csr 100000
+
+import sys
+import tracemalloc
+from random import Random
+from time import time
+from .graph import Graph
+from .csr_graph import CSRGraph
+from .bfs import BFS_complete
+from .shortest_paths import shortest_path_lengths
+
+try:
+  n = int(sys.argv[1])
+except:
+  n = 100000
+
+def random_weighted_graph(n, m, seed=0):
+  """Return an undirected graph with n vertices and about m weighted edges."""
+  rand = Random(seed)
+  g = Graph()
+  verts = [g.insert_vertex(k) for k in range(n)]
+  for k in range(m):
+    u = verts[rand.randrange(n)]
+    v = verts[rand.randrange(n)]
+    if u is not v and g.get_edge(u, v) is None:
+      g.insert_edge(u, v, rand.randint(1, 100))
+  return g
+
+def measure(build):
+  """Return (result, bytes allocated) for calling build()."""
+  tracemalloc.start()
+  result = build()
+  size = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  return result, size
+
+def timed(f, *args):
+  """Return seconds elapsed during a call f(*args)."""
+  start = time()
+  f(*args)
+  return time() - start
+
+g, graph_bytes = measure(lambda: random_weighted_graph(n, 4 * n))
+csr, csr_bytes = measure(lambda: CSRGraph(g))
+src = next(iter(g.vertices()))
+
+print('Vertices {0}, edges {1}'.format(g.vertex_count(), g.edge_count()))
+print('{0:>24} {1:>12} {2:>12}'.format('', 'Graph', 'CSRGraph'))
+print('{0:>24} {1:>12.1f} {2:>12.1f}'.format(
+  'memory (MB)', graph_bytes / 2**20, csr_bytes / 2**20))
+print('{0:>24} {1:>12.3f} {2:>12.3f}'.format(
+  'BFS_complete (s)', timed(BFS_complete, g), timed(BFS_complete, csr)))
+print('{0:>24} {1:>12.3f} {2:>12.3f}'.format(
+  'shortest_path_lengths (s)', timed(shortest_path_lengths, g, src),
+  timed(shortest_path_lengths, csr, csr.vertex_id(src))))
@@ -35,8 +35,9 @@ class Graph:
       """Return element associated with this vertex."""
       return self._element
   
-    def __hash__(self):         # will allow vertex to be a map/set key
-      return hash(id(self))
+    # will allow vertex to be a map/set key; the inherited identity-based hash
+    # is computed in C, avoiding a Python call on every dictionary access
+    __hash__ = object.__hash__
 
     def __str__(self):
       return str(self._element)
@@ -67,21 +68,29 @@ class Graph:
       """Return element associated with this edge."""
       return self._element
   
-    def __hash__(self):         # will allow edge to be a map/set key
-      return hash( (self._origin, self._destination) )
+    __hash__ = object.__hash__  # will allow edge to be a map/set key
 
     def __str__(self):
       return '({0},{1},{2})'.format(self._origin,self._destination,self._element)
     
   #------------------------- Graph methods -------------------------
-  def __init__(self, directed=False):
+  def __init__(self, directed=False, log_changes=False):
     """Create an empty graph (undirected, by default).
 
     Graph is directed if optional paramter is set to True.
+    If log_changes is True, the graph keeps a log of its modifications
+    (see the changes method).
     """
     self._outgoing = {}
     # only create second map for directed graph; use alias for undirected
     self._incoming = {} if directed else self._outgoing
+    self._num_edges = 0               # maintained as edges come and go
+    self._log = [] if log_changes else None
+
+  def _record(self, action, item):
+    """Append (action, item) to the change log, if there is one."""
+    if self._log is not None:
+      self._log.append((action, item))
 
   def _validate_vertex(self, v):
     """Verify that v is a Vertex of this graph."""
@@ -107,16 +116,16 @@ class Graph:
 
   def edge_count(self):
     """Return the number of edges in the graph."""
-    total = sum(len(self._outgoing[v]) for v in self._outgoing)
-    # for undirected graphs, make sure not to double-count edges
-    return total if self.is_directed() else total // 2
+    return self._num_edges
 
   def edges(self):
-    """Return a set of all edges of the graph."""
-    result = set()       # avoid double-reporting edges of undirected graph
-    for secondary_map in self._outgoing.values():
-      result.update(secondary_map.values())    # add edges to resulting set
-    return result
+    """Generate all edges of the graph, reporting each edge once."""
+    directed = self.is_directed()
+    for u, secondary_map in self._outgoing.items():
+      for e in secondary_map.values():
+        # an undirected edge is in the maps of both endpoints; report at origin
+        if directed or e._origin is u:
+          yield e
 
   def get_edge(self, u, v):
     """Return the edge from u to v, or None if not adjacent."""
@@ -143,12 +152,37 @@ class Graph:
     for edge in adj[v].values():
       yield edge
 
+  def neighbors(self, v, outgoing=True):
+    """Return a view of (u, e) pairs for the (outgoing) edges e=(v,u) at v.
+
+    If graph is directed, optional parameter used to request incoming edges.
+    Unlike incident_edges, v is not validated and the result comes straight
+    from the adjacency map, so this is intended for trusted inner loops of
+    graph algorithms. The graph must not be modified during the iteration.
+    """
+    adj = self._outgoing if outgoing else self._incoming
+    return adj[v].items()
+
+  def changes(self, start=0):
+    """Return a list of the logged modifications, beginning at index start.
+
+    Each entry is a pair (action, item), where action is one of the strings
+    'insert_vertex', 'insert_edge', 'remove_edge' or 'remove_vertex' and
+    item is the affected Vertex or Edge. The log only grows, so a consumer
+    can remember how many entries it has seen and pass that as start.
+    Raise a ValueError if the graph was not created with log_changes=True.
+    """
+    if self._log is None:
+      raise ValueError('graph does not log changes')
+    return self._log[start:]
+
   def insert_vertex(self, x=None):
     """Insert and return a new Vertex with element x."""
     v = self.Vertex(x)
     self._outgoing[v] = {}
     if self.is_directed():
       self._incoming[v] = {}        # need distinct map for incoming edges
+    self._record('insert_vertex', v)
     return v
       
   def insert_edge(self, u, v, x=None):
@@ -162,3 +196,40 @@ class Graph:
     e = self.Edge(u, v, x)
     self._outgoing[u][v] = e
     self._incoming[v][u] = e
+    self._num_edges += 1
+    self._record('insert_edge', e)
+    return e
+
+  def remove_edge(self, e):
+    """Remove Edge e from the graph and return its element.
+
+    Raise a ValueError if e is not an edge of the graph.
+    """
+    if not isinstance(e, self.Edge):
+      raise TypeError('Edge expected')
+    u, v = e._origin, e._destination
+    if u not in self._outgoing or self._outgoing[u].get(v) is not e:
+      raise ValueError('Edge does not belong to this graph.')
+    del self._outgoing[u][v]
+    if u is not v or self.is_directed():   # undirected loop has one entry
+      del self._incoming[v][u]
+    self._num_edges -= 1
+    self._record('remove_edge', e)
+    return e._element
+
+  def remove_vertex(self, v):
+    """Remove Vertex v and all of its incident edges; return its element.
+
+    The running time is proportional to the degree of v.
+    """
+    self._validate_vertex(v)
+    incident = list(self._outgoing[v].values())
+    if self.is_directed():                 # a loop is in both maps
+      incident.extend(e for w, e in self._incoming[v].items() if w is not v)
+    for e in incident:
+      self.remove_edge(e)
+    del self._outgoing[v]
+    if self.is_directed():
+      del self._incoming[v]
+    self._record('remove_vertex', v)
+    return v._element
@@ -19,6 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import gc
+from functools import wraps
+from random import Random
 from .graph import Graph
 
 def graph_from_edgelist(E, directed=False):
@@ -48,6 +51,127 @@ def graph_from_edgelist(E, directed=False):
 
   return g
 
+def _without_gc(generator):
+  """Decorate a graph generator to run with cyclic garbage collection off.
+
+  Building a large graph creates millions of objects but no cyclic garbage,
+  and repeated collections would otherwise dominate the running time.
+  """
+  @wraps(generator)
+  def wrapper(*args, **kwargs):
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+      return generator(*args, **kwargs)
+    finally:
+      if collecting:
+        gc.enable()
+  return wrapper
+
+def _bulk_graph(elements, pairs, directed, max_weight, rand):
+  """Return a graph with the given vertex elements and (i,j) index pairs.
+
+  The pairs must be distinct (and not repeated in reverse if undirected), so
+  edges are placed in the adjacency maps directly, without the adjacency
+  checks of insert_edge. Edge elements are random integers from 1 to
+  max_weight, or None if max_weight is None.
+  """
+  g = Graph(directed)
+  verts = [g.insert_vertex(x) for x in elements]
+  outgoing, incoming, Edge = g._outgoing, g._incoming, g.Edge
+  random = rand.random
+  for i, j in pairs:
+    u, v = verts[i], verts[j]
+    x = None if max_weight is None else 1 + int(random() * max_weight)
+    e = Edge(u, v, x)
+    outgoing[u][v] = e
+    incoming[v][u] = e                  # same map as outgoing if undirected
+    g._num_edges += 1
+  return g
+
+@_without_gc
+def erdos_renyi_graph(n, m, directed=False, max_weight=None, seed=None):
+  """Return a random graph with n vertices and m edges, all equally likely.
+
+  Vertex elements are the integers 0 to n-1. Edge elements are random
+  integer weights from 1 to max_weight, or None if max_weight is None.
+  Equal seeds produce equal graphs.
+  """
+  limit = n * (n - 1) if directed else n * (n - 1) // 2
+  if m > limit:
+    raise ValueError('too many edges for a simple graph')
+  rand = Random(seed)
+  random = rand.random                  # much faster than rand.randrange
+  pairs = set()
+  while len(pairs) < m:
+    i, j = int(random() * n), int(random() * n)
+    if i != j:
+      pairs.add((i, j) if directed or i < j else (j, i))
+  return _bulk_graph(range(n), pairs, directed, max_weight, rand)
+
+@_without_gc
+def grid_graph(rows, cols, max_weight=None, seed=None):
+  """Return an undirected rows-by-cols grid graph.
+
+  Vertex elements are (row, column) pairs, and each vertex is adjacent to the
+  vertices above, below, left and right of it. Edge elements are as for
+  erdos_renyi_graph.
+  """
+  elements = [(r, c) for r in range(rows) for c in range(cols)]
+  pairs = []
+  for r in range(rows):
+    for c in range(cols):
+      k = r * cols + c
+      if c + 1 < cols:
+        pairs.append((k, k + 1))
+      if r + 1 < rows:
+        pairs.append((k, k + cols))
+  return _bulk_graph(elements, pairs, False, max_weight, Random(seed))
+
+@_without_gc
+def barabasi_albert_graph(n, k, max_weight=None, seed=None):
+  """Return an undirected power-law graph grown by preferential attachment.
+
+  Vertices 0 to k-1 start without edges; each later vertex is joined to k
+  distinct earlier vertices, chosen with probability proportional to their
+  degree (Barabasi-Albert model). Edge elements are as for erdos_renyi_graph.
+  """
+  if not 0 < k < n:
+    raise ValueError('k must be positive and less than n')
+  rand = Random(seed)
+  random = rand.random
+  pairs = []
+  ends = []                             # each vertex appears once per degree
+  targets = list(range(k))              # the first vertex joins all k
+  for v in range(k, n):
+    for u in targets:
+      pairs.append((u, v))
+    ends.extend(targets)
+    ends.extend([v] * k)
+    chosen = set()
+    while len(chosen) < k:
+      chosen.add(ends[int(random() * len(ends))])
+    targets = chosen
+  return _bulk_graph(range(n), pairs, False, max_weight, rand)
+
+@_without_gc
+def random_dag(n, m, max_weight=None, seed=None):
+  """Return a random directed acyclic graph with n vertices and m edges.
+
+  Vertex elements are the integers 0 to n-1, and every edge goes from a
+  smaller to a larger element. Edge elements are as for erdos_renyi_graph.
+  """
+  if m > n * (n - 1) // 2:
+    raise ValueError('too many edges for an acyclic graph')
+  rand = Random(seed)
+  random = rand.random                  # much faster than rand.randrange
+  pairs = set()
+  while len(pairs) < m:
+    i, j = int(random() * n), int(random() * n)
+    if i != j:
+      pairs.add((i, j) if i < j else (j, i))
+  return _bulk_graph(range(n), pairs, True, max_weight, rand)
+
 def figure_14_3():
   """Return the unweighted, directed graph from Figure 14.3 of DSAP."""
   E = (
@@ -0,0 +1,137 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import io
+import mmap
+import struct
+from time import time
+from .graph import Graph
+
+def _mapped(f):
+  """Return a read-only memory map of open file f, or its bytes if unmappable.
+
+  An empty file cannot be mapped, nor can a pipe or terminal such as
+  /dev/stdin; their contents are read into memory instead.
+  """
+  try:
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  except (ValueError, OSError):
+    return f.read()
+
+def _text_records(data, label, weight):
+  """Generate (u,v,x) label triples from the lines of a text edge list.
+
+  Blank lines and lines starting with '#' or '%' are skipped.
+  """
+  if not isinstance(data, mmap.mmap):
+    data = io.BytesIO(data)             # file contents that were not mapped
+  for line in iter(data.readline, b''):
+    fields = line.split()
+    if fields and fields[0][:1] not in (b'#', b'%'):
+      x = weight(fields[2]) if len(fields) > 2 else None
+      yield label(fields[0]), label(fields[1]), x
+
+def _binary_records(data, fmt):
+  """Generate (u,v,x) triples from fixed-size records packed with struct fmt."""
+  size = struct.calcsize(fmt)
+  if len(data) % size != 0:
+    raise ValueError('file length is not a multiple of the record size')
+  for record in struct.iter_unpack(fmt, data):
+    yield record[0], record[1], record[2] if len(record) > 2 else None
+
+def load_edgelist(path, directed=False, fmt=None, label=bytes.decode,
+                  weight=float, report=None, report_every=1000000):
+  """Load a graph from the edge list stored in the named file.
+
+  By default the file is text with one edge per line, given as two vertex
+  labels and an optional weight separated by whitespace.  Labels are
+  converted with the label function and weights with the weight function
+  (both receive bytes).  If fmt is given, the file instead holds fixed-size
+  binary records packed according to that struct format, such as '<qq' or
+  '<iid'; the first two fields are the endpoints and an optional third field
+  is the edge element.
+
+  The file is read through a memory map (or read into memory if it cannot
+  be mapped, as for a pipe) and the adjacency maps are filled in a single
+  pass with no per-edge validation, so the file must describe a simple graph
+  (a repeated pair silently replaces the earlier edge).
+
+  If report is given, report(edges, seconds) is called after every
+  report_every edges and at the end, allowing throughput to be tracked.
+  """
+  g = Graph(directed)
+  start = time()
+  collecting = gc.isenabled()
+  gc.disable()                          # loading creates no cyclic garbage
+  try:
+    with open(path, 'rb') as f:
+      data = _mapped(f)
+      if fmt is None:
+        records = _text_records(data, label, weight)
+      else:
+        records = _binary_records(data, fmt)
+      try:
+        count = _fill(g, records, report, report_every, start)
+      finally:
+        records.close()                 # release buffer before unmapping
+        if isinstance(data, mmap.mmap):
+          data.close()
+  finally:
+    if collecting:
+      gc.enable()
+  if report is not None and (count == 0 or count % report_every != 0):
+    report(count, time() - start)       # final tally, unless just reported
+  return g
+
+def _fill(g, records, report, report_every, start):
+  """Insert edges from the (u,v,x) records into g and return their number."""
+  outgoing, incoming, Edge = g._outgoing, g._incoming, g.Edge
+  verts = {}                            # map from vertex label to Vertex
+  count = 0
+  for a, b, x in records:
+    u = verts.get(a)
+    if u is None:
+      u = verts[a] = g.insert_vertex(a)
+    v = verts.get(b)
+    if v is None:
+      v = verts[b] = g.insert_vertex(b)
+    e = Edge(u, v, x)
+    secondary_map = outgoing[u]
+    if v not in secondary_map:          # a repeated pair is not a new edge
+      g._num_edges += 1
+    secondary_map[v] = e                # same map twice if undirected
+    incoming[v][u] = e
+    count += 1
+    if report is not None and count % report_every == 0:
+      report(count, time() - start)
+  return count
+
+def print_throughput(edges, seconds):
+  """Report callback for load_edgelist that prints the loading rate."""
+  rate = edges / seconds if seconds > 0 else float('inf')
+  print('{0} edges in {1:.1f} s ({2:.0f} edges/s)'.format(edges, seconds, rate))
+
+if __name__ == '__main__':
+  import sys
+  g = load_edgelist(sys.argv[1], report=print_throughput)
+  print("Number of vertices is", g.vertex_count())
+  print("Number of edges is", g.edge_count())
@@ -0,0 +1,185 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Binary file layout (all integers are 64-bit in native byte order):
+#
+#   header    magic, version, flags, n, slots, offset and length of the pickle
+#   offsets   n+1 integers        (outgoing CSR arrays)
+#   targets   slots integers
+#   weights   slots integers or doubles, if edge elements are numeric
+#   incoming  n+1 offsets, then slots targets and slots slot numbers (directed)
+#   pickle    list of vertex elements, and edge elements if not numeric
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from .csr_graph import CSRGraph
+
+class _BinaryFormat:
+  """Layout of a binary file of 64-bit arrays, for saving and memory-mapping.
+
+  The file begins with a header packed by struct format header, whose first
+  three fields are magic bytes, a version number and flag bits; the flag bit
+  big_endian records the byte order of the writer.  The arrays follow in
+  native byte order.  kind names the sort of file in error messages.
+  """
+
+  def __init__(self, kind, magic, version, header, big_endian):
+    self.kind = kind
+    self.magic = magic
+    self.version = version
+    self.header = struct.Struct(header)
+    self.big_endian = big_endian
+
+  def save(self, path, flags, values, arrays, tail=b''):
+    """Write the header fields after flags, then arrays, then tail bytes."""
+    if sys.byteorder == 'big':
+      flags |= self.big_endian
+    with open(path, 'wb') as f:
+      f.write(self.header.pack(self.magic, self.version, flags, *values))
+      for a in arrays:
+        f.write(memoryview(a).cast('B'))
+      f.write(tail)
+
+  def load(self, path):
+    """Memory-map the named file and check its header.
+
+    Return (view, fields, take): a memoryview of the whole file, the header
+    fields from flags onward, and a function take(count, typecode='q') that
+    returns a view of the next count 64-bit values following the header.
+    """
+    with open(path, 'rb') as f:
+      data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    fields = self.header.unpack_from(data)
+    if fields[0] != self.magic:
+      raise ValueError('not a {0} file'.format(self.kind))
+    if fields[1] != self.version:
+      raise ValueError('unsupported {0} file version {1}'.format(
+        self.kind, fields[1]))
+    if bool(fields[2] & self.big_endian) != (sys.byteorder == 'big'):
+      raise ValueError('{0} file was written with a different byte '
+                       'order'.format(self.kind))
+    view = memoryview(data)
+    position = self.header.size
+
+    def take(count, typecode='q'):
+      nonlocal position
+      part = view[position:position + 8 * count].cast(typecode)
+      position += 8 * count
+      return part
+
+    return view, fields[2:], take
+
+MAGIC = b'DSAPGRPH'
+VERSION = 1
+
+_DIRECTED = 1                           # flag bits
+_INT_WEIGHTS = 2
+_FLOAT_WEIGHTS = 4
+_BIG_ENDIAN = 8
+
+_FORMAT = _BinaryFormat('graph', MAGIC, VERSION, '=8sIIqqqq', _BIG_ENDIAN)
+
+class _LazyElements:
+  """Sequence of elements unpickled from a buffer on first access."""
+  __slots__ = '_buffer', '_items'
+
+  def __init__(self, buffer):
+    self._buffer = buffer
+    self._items = None
+
+  def _load(self):
+    if self._items is None:
+      self._items = pickle.loads(self._buffer)
+      self._buffer = None
+    return self._items
+
+  def __getitem__(self, i):
+    return self._load()[0][i]
+
+  def __len__(self):
+    return len(self._load()[0])
+
+class _EdgeElements:
+  """Sequence of the pickled edge elements that share a _LazyElements buffer."""
+  __slots__ = '_source'
+
+  def __init__(self, source):
+    self._source = source
+
+  def __getitem__(self, k):
+    return self._source._load()[1][k]
+
+  def __len__(self):
+    return len(self._source._load()[1])
+
+def save_graph(g, path):
+  """Write Graph (or CSRGraph) g to the named file in binary form."""
+  csr = g if isinstance(g, CSRGraph) else CSRGraph(g)
+  n = csr.vertex_count()
+  flags = _DIRECTED if csr.is_directed() else 0
+  arrays = [csr._offsets, csr._targets]
+  weights = csr._weights
+  # numeric weights are an array, or a memoryview if g came from load_graph
+  kind = (memoryview(weights).format
+          if isinstance(weights, (array, memoryview)) else None)
+  if kind in ('q', 'd'):
+    flags |= _INT_WEIGHTS if kind == 'q' else _FLOAT_WEIGHTS
+    arrays.append(weights)
+    tail = pickle.dumps((list(csr._elements), None), pickle.HIGHEST_PROTOCOL)
+  else:                                 # arbitrary edge elements are pickled
+    tail = pickle.dumps((list(csr._elements), list(weights)),
+                        pickle.HIGHEST_PROTOCOL)
+  if csr.is_directed():
+    arrays.extend((csr._in_offsets, csr._in_targets, csr._in_slots))
+  body = sum(8 * len(a) for a in arrays)
+  _FORMAT.save(path, flags, (n, len(csr._targets),
+                             _FORMAT.header.size + body, len(tail)),
+               arrays, tail)
+
+def load_graph(path):
+  """Return a read-only CSRGraph for the graph stored in the named file.
+
+  The file is memory-mapped and its arrays are used in place, so loading
+  takes time independent of the number of edges. Vertex elements (and edge
+  elements that are not numeric) are unpickled on first use. Call to_graph()
+  on the result to obtain a modifiable Graph.
+  """
+  view, (flags, n, slots, tail, size), take = _FORMAT.load(path)
+  offsets = take(n + 1)
+  targets = take(slots)
+  elements = _LazyElements(view[tail:tail + size])
+  if flags & _INT_WEIGHTS:
+    weights = take(slots)
+  elif flags & _FLOAT_WEIGHTS:
+    weights = take(slots, 'd')
+  else:
+    weights = _EdgeElements(elements)
+  incoming = ()
+  if flags & _DIRECTED:
+    incoming = (take(n + 1), take(slots), take(slots))
+  csr = CSRGraph._from_arrays(bool(flags & _DIRECTED), elements, offsets,
+                              targets, weights, *incoming)
+  csr._path = os.path.abspath(path)     # workers may run in another directory
+  return csr
@@ -0,0 +1,151 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+class _FilteredVertices:
+  """Re-iterable collection of the vertices that pass a view's filter."""
+  __slots__ = '_vertices', '_keep'
+
+  def __init__(self, vertices, keep):
+    self._vertices = vertices           # vertices of the underlying graph
+    self._keep = keep
+
+  def __iter__(self):
+    return filter(self._keep, self._vertices)
+
+  def __contains__(self, v):
+    return v in self._vertices and self._keep(v)
+
+  def __len__(self):
+    return sum(1 for v in self)
+
+class SubgraphView:
+  """Read-only view of part of a graph, filtered lazily without copying.
+
+  A vertex of the underlying graph belongs to the view if it satisfies the
+  vertex filter, and an edge belongs if it satisfies the edge filter and
+  both its endpoints belong. Each query consults the adjacency structure of
+  the underlying graph (a Graph, CSRGraph, or another view), so the view
+  reflects later changes to it and costs O(1) space.
+
+  The view supports the read-only portion of the Graph interface, so that
+  the algorithms of this chapter run directly on it.  Note that counting
+  vertices or edges takes time proportional to the underlying graph.
+  """
+  __slots__ = '_graph', '_keep_vertex', '_keep_edge'
+
+  def __init__(self, g, vertex_filter=None, edge_filter=None):
+    """Create a view of g with the vertices v for which vertex_filter(v) and
+    the edges e for which edge_filter(e) are true (all of them, if None).
+    """
+    self._graph = g
+    self._keep_vertex = vertex_filter
+    self._keep_edge = edge_filter
+
+  def _includes(self, v):
+    return self._keep_vertex is None or self._keep_vertex(v)
+
+  def _validate_vertex(self, v):
+    """Verify that v is a vertex of this view."""
+    self._graph._validate_vertex(v)     # a vertex of the underlying graph
+    if not self._includes(v):
+      raise ValueError('Vertex does not belong to this view.')
+
+  def graph(self):
+    """Return the underlying graph."""
+    return self._graph
+
+  def is_directed(self):
+    """Return True if this is a directed graph; False if undirected."""
+    return self._graph.is_directed()
+
+  def vertex_count(self):
+    """Return the number of vertices in the view."""
+    return len(self.vertices())
+
+  def vertices(self):
+    """Return an iteration of all vertices of the view.
+
+    As with Graph.vertices, the result may be iterated more than once.
+    """
+    if self._keep_vertex is None:
+      return self._graph.vertices()
+    return _FilteredVertices(self._graph.vertices(), self._keep_vertex)
+
+  def edge_count(self):
+    """Return the number of edges in the view."""
+    return sum(1 for e in self.edges())
+
+  def edges(self):
+    """Generate all edges of the view, reporting each edge once."""
+    keep_edge = self._keep_edge
+    for e in self._graph.edges():
+      if keep_edge is None or keep_edge(e):
+        u, v = e.endpoints()
+        if self._includes(u) and self._includes(v):
+          yield e
+
+  def get_edge(self, u, v):
+    """Return the edge from u to v, or None if not adjacent in the view."""
+    self._validate_vertex(u)
+    self._validate_vertex(v)
+    e = self._graph.get_edge(u, v)
+    if e is not None and self._keep_edge is not None and not self._keep_edge(e):
+      return None
+    return e
+
+  def degree(self, v, outgoing=True):
+    """Return number of (outgoing) edges incident to vertex v in the view.
+
+    If graph is directed, optional parameter used to count incoming edges.
+    """
+    self._validate_vertex(v)
+    return sum(1 for pair in self.neighbors(v, outgoing))
+
+  def incident_edges(self, v, outgoing=True):
+    """Return all (outgoing) edges incident to vertex v in the view.
+
+    If graph is directed, optional parameter used to request incoming edges.
+    """
+    self._validate_vertex(v)
+    for u, e in self.neighbors(v, outgoing):
+      yield e
+
+  def neighbors(self, v, outgoing=True):
+    """Generate (u, e) pairs for the (outgoing) edges e=(v,u) of the view.
+
+    As with Graph.neighbors, v is not validated.
+    """
+    keep_vertex, keep_edge = self._keep_vertex, self._keep_edge
+    for u, e in self._graph.neighbors(v, outgoing):
+      if ((keep_vertex is None or keep_vertex(u)) and
+          (keep_edge is None or keep_edge(e))):
+        yield u, e
+
+def induced_subgraph(g, vertices):
+  """Return a view of the subgraph of g induced by a collection of vertices.
+
+  The collection should support fast membership tests, such as a set.
+  """
+  return SubgraphView(g, vertex_filter=vertices.__contains__)
+
+def edges_below(g, threshold):
+  """Return a view of g with only the edges whose element is below threshold."""
+  return SubgraphView(g, edge_filter=lambda e: e.element() < threshold)
@@ -0,0 +1,150 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from random import Random
+from .shortest_paths import shortest_path_lengths, astar_path_length
+from .shortest_paths import shortest_path_length
+
+class _Reversed:
+  """Read-only view of a directed graph with every edge reversed.
+
+  It offers just enough of the Graph interface for shortest_path_lengths.
+  """
+  __slots__ = '_graph'
+
+  def __init__(self, g):
+    self._graph = g
+
+  def vertices(self):
+    return self._graph.vertices()
+
+  def edges(self):
+    return self._graph.edges()          # only the weights are examined
+
+  def neighbors(self, v, outgoing=True):
+    return self._graph.neighbors(v, not outgoing)
+
+class Landmarks:
+  """Distance tables for a few landmark vertices, giving A* lower bounds.
+
+  By the triangle inequality, the distance from v to t is at least
+  d(L,t)-d(L,v) and d(v,L)-d(t,L) for every landmark L (ALT search).
+  Each table is an array of doubles indexed by vertex position, in which
+  unreachable vertices have infinite distance.
+  """
+
+  def __init__(self, g, k=8, method='farthest', seed=None):
+    """Choose k landmarks of weighted graph g and compute their tables.
+
+    method is 'farthest' (each landmark is a vertex farthest from those
+    already chosen, starting from a random one) or 'random'.  seed makes
+    the random choices repeatable.
+    """
+    if method not in ('farthest', 'random'):
+      raise ValueError("method must be 'farthest' or 'random'")
+    if k < 1:
+      raise ValueError('at least one landmark is required')
+    self._graph = g
+    verts = list(g.vertices())
+    self._index = {v: i for i, v in enumerate(verts)}
+    k = min(k, len(verts))
+    rand = Random(seed)
+    self._landmarks = []
+    self._from = []                     # self._from[j][i] is d(L_j, v_i)
+    self._to = []                       # self._to[j][i] is d(v_i, L_j)
+    if method == 'random':
+      for v in rand.sample(verts, k):
+        self._add(v)
+    elif k > 0:
+      self._add(rand.choice(verts))
+      nearest = list(self._from[0])     # distance to nearest landmark
+      while len(self._landmarks) < k:
+        far = max(range(len(verts)), key=nearest.__getitem__)
+        self._add(verts[far])
+        nearest = [min(a, b) for a, b in zip(nearest, self._from[-1])]
+
+  def _add(self, v):
+    """Append v as a landmark, with its table (or tables, if directed)."""
+    g = self._graph
+    self._landmarks.append(v)
+    self._from.append(self._table(shortest_path_lengths(g, v)))
+    if g.is_directed():
+      self._to.append(self._table(shortest_path_lengths(_Reversed(g), v)))
+
+  def _table(self, lengths):
+    table = array('d', bytes(8 * len(self._index)))
+    for v, d in lengths.items():
+      table[self._index[v]] = d
+    return table
+
+  def landmarks(self):
+    """Return a list of the landmark vertices, in the order chosen."""
+    return list(self._landmarks)
+
+  def heuristic(self, dest):
+    """Return a function h such that h(v) bounds the distance from v to dest.
+
+    The function is consistent, as required by astar_path_length.
+    """
+    t = self._index[dest]
+    index = self._index
+    pairs = [(table, table[t]) for table in self._from]
+    # in an undirected graph d(v,L) = d(L,v), so both bounds use _from
+    to_tables = self._to if self._graph.is_directed() else self._from
+    reverse = [(table, table[t]) for table in to_tables]
+
+    def h(v):
+      i = index[v]
+      best = 0
+      for table, at_dest in pairs:
+        bound = at_dest - table[i]      # d(L,t) - d(L,v)
+        if bound > best:                # false when bound is not a number
+          best = bound
+      for table, at_dest in reverse:
+        bound = table[i] - at_dest      # d(v,L) - d(t,L)
+        if bound > best:
+          best = bound
+      return best
+    return h
+
+  def lower_bound(self, u, v):
+    """Return the largest landmark lower bound on the distance from u to v."""
+    return self.heuristic(v)(u)
+
+  def distance(self, u, v, cloud=None):
+    """Return the shortest-path distance from u to v, or None if unreachable.
+
+    The query is an A* search guided by the landmark bounds.  If cloud is
+    given as an empty dictionary, each settled vertex is added to it.
+    """
+    return astar_path_length(self._graph, u, v, self.heuristic(v), cloud)
+
+  def settled_counts(self, u, v):
+    """Return (landmark, plain) numbers of vertices settled by a u-v query.
+
+    The first number is for the A* search of the distance method, the
+    second for Dijkstra's algorithm stopping at v (shortest_path_length).
+    """
+    alt, plain = {}, {}
+    self.distance(u, v, alt)
+    shortest_path_length(self._graph, u, v, plain)
+    return len(alt), len(plain)
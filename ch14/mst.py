@@ -19,8 +19,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from ..ch09.pq import HeapPriorityQueue,AdaptableHeapPriorityQueue
-from .partition import Partition
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from ..ch09.heap_priority_queue import HeapPriorityQueue
+from ..ch09.adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+from .partition import IndexedPartition
 
 def MST_PrimJarnik(g):
   """Compute a minimum spanning tree of weighted graph g.
@@ -47,8 +50,7 @@ def MST_PrimJarnik(g):
     del pqlocator[u]                                # u is no longer in pq
     if edge is not None:
       tree.append(edge)                             # add edge to tree
-    for link in g.incident_edges(u):
-      v = link.opposite(u)
+    for v, link in g.neighbors(u):
       if v in pqlocator:                            # thus v not yet in tree
         # see if edge (u,v) better connects v to the growing tree
         wgt = link.element()
@@ -58,33 +60,126 @@ def MST_PrimJarnik(g):
 
   return tree
 
-def MST_Kruskal(g):
+def MST_Kruskal(g, presort=False):
   """Compute a minimum spanning tree of a graph using Kruskal's algorithm.
 
   Return a list of edges that comprise the MST.
 
   The elements of the graph's edges are assumed to be weights.
+
+  If presort is True, all edges are sorted by weight once (with a stable sort)
+  rather than being managed in a heap-based priority queue; for large sparse
+  graphs this avoids most of the priority queue overhead.
   """
   tree = []                   # list of edges in spanning tree
-  pq = HeapPriorityQueue()    # entries are edges in G, with weights as key
-  forest = Partition()        # keeps track of forest clusters
-  position = {}               # map each node to its Partition entry
+  position = {}               # map each node to its index in the forest
 
   for v in g.vertices():
-    position[v] = forest.make_group(v)
+    position[v] = len(position)
+  forest = IndexedPartition(len(position))   # keeps track of forest clusters
+  size = g.vertex_count()
 
+  if presort:
+    for edge in sorted(g.edges(), key=lambda e: e.element()):
+      u,v = edge.endpoints()
+      if forest.union(position[u], position[v]):   # merged two clusters
+        tree.append(edge)
+        if len(tree) == size - 1:
+          break                                    # tree is spanning
+    return tree
+
+  pq = HeapPriorityQueue()    # entries are edges in G, with weights as key
   for e in g.edges():
     pq.add(e.element(), e)    # edge's element is assumed to be its weight
 
-  size = g.vertex_count()
   while len(tree) != size - 1 and not pq.is_empty():
     # tree not spanning and unprocessed edges remain
     weight,edge = pq.remove_min()
     u,v = edge.endpoints()
-    a = forest.find(position[u])
-    b = forest.find(position[v])
-    if a != b:
+    if forest.union(position[u], position[v]):   # merged two clusters
       tree.append(edge)
-      forest.union(a,b)
+
+  return tree
+
+#------------------------- Boruvka's algorithm -------------------------
+_edge_data = None             # (origins, destinations, weights) in a worker
+
+def _init_worker(origins, destinations, weights):
+  """Install the edge arrays in a worker process of the pool."""
+  global _edge_data
+  _edge_data = (origins, destinations, weights)
+
+def _cheapest_edges(cluster, start, stop, edge_data=None):
+  """Return map from each cluster to its cheapest edge in a range of edges.
+
+  cluster[i] is the cluster of vertex i. Each map value is a (weight, index)
+  pair, so that edges of equal weight are ordered consistently.
+  """
+  origins, destinations, weights = edge_data or _edge_data
+  best = {}
+  for k in range(start, stop):
+    a = cluster[origins[k]]
+    b = cluster[destinations[k]]
+    if a != b:                                 # edge leaves both clusters
+      candidate = (weights[k], k)
+      if a not in best or candidate < best[a]:
+        best[a] = candidate
+      if b not in best or candidate < best[b]:
+        best[b] = candidate
+  return best
+
+def MST_Boruvka(g, processes=None):
+  """Compute a minimum spanning tree of a graph using Boruvka's algorithm.
+
+  Return a list of edges that comprise the MST (a spanning forest if g is not
+  connected). The elements of the graph's edges are assumed to be weights.
+
+  In each round every cluster selects its cheapest outgoing edge, and all
+  selected edges are added at once. If processes is given, the scan for
+  those edges is divided among a pool of that many worker processes.
+  Raise a ValueError if processes is less than 1.
+  """
+  if processes is not None and processes < 1:
+    raise ValueError('processes must be at least 1')
+  position = {}               # map each node to its index in the forest
+  for v in g.vertices():
+    position[v] = len(position)
+  edges = list(g.edges())
+  if not edges:
+    return []                 # nothing to scan (and no pool to start)
+  origins = array('q', (position[e.endpoints()[0]] for e in edges))
+  destinations = array('q', (position[e.endpoints()[1]] for e in edges))
+  weights = [e.element() for e in edges]
+  forest = IndexedPartition(len(position))
+  tree = []
+
+  pool = None
+  if processes is not None:
+    pool = ProcessPoolExecutor(processes, initializer=_init_worker,
+                               initargs=(origins, destinations, weights))
+    chunk = -(-len(edges) // processes)        # ceiling division
+  try:
+    while True:
+      cluster = array('q', (forest.find(i) for i in range(len(position))))
+      if pool is None:
+        best = _cheapest_edges(cluster, 0, len(edges),
+                               (origins, destinations, weights))
+      else:
+        best = {}
+        jobs = [pool.submit(_cheapest_edges, cluster, start,
+                            min(start + chunk, len(edges)))
+                for start in range(0, len(edges), chunk)]
+        for job in jobs:                       # merge the partial results
+          for a, candidate in job.result().items():
+            if a not in best or candidate < best[a]:
+              best[a] = candidate
+      if not best:
+        break                                  # no edge leaves any cluster
+      for weight, k in set(best.values()):     # an edge may be chosen twice
+        if forest.union(origins[k], destinations[k]):
+          tree.append(edges[k])
+  finally:
+    if pool is not None:
+      pool.shutdown()
 
   return tree
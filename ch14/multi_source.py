@@ -0,0 +1,128 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from heapq import heappush, heappop
+from .csr_graph import CSRGraph
+from .graph_store import load_graph
+
+_graph = None                 # the shared CSRGraph, within a worker process
+
+def _init_worker(graph, path=None):
+  """Install the shared graph in a worker process of the pool.
+
+  If path is given, the worker maps that graph file itself instead.
+  """
+  global _graph
+  _graph = graph if path is None else load_graph(path)
+
+def hop_distances(g, src):
+  """Return a dictionary mapping each vertex reachable from src to its depth.
+
+  g must be a CSRGraph; the search reads its arrays without creating edges.
+  """
+  level = {src: 0}
+  frontier = [src]
+  hops = 0
+  while frontier:
+    hops += 1
+    next_frontier = []
+    for u in frontier:
+      for v in g.adjacency(u)[0]:
+        if v not in level:
+          level[v] = hops
+          next_frontier.append(v)
+    frontier = next_frontier
+  return level
+
+def weighted_distances(g, src):
+  """Return a dictionary mapping each vertex reachable from src to distance.
+
+  g must be a CSRGraph with numeric edge weights. This is Dijkstra's
+  algorithm over the raw arrays, using a binary heap (the heapq module) that
+  may hold stale entries rather than an adaptable priority queue.
+  """
+  cloud = {}
+  d = {src: 0}
+  heap = [(0, src)]
+  while heap:
+    key, u = heappop(heap)
+    if u in cloud:
+      continue                                 # stale entry for settled u
+    cloud[u] = key
+    targets, weights = g.adjacency(u)
+    for k in range(len(targets)):
+      v = targets[k]
+      if v not in cloud:
+        dist = key + weights[k]
+        if v not in d or dist < d[v]:          # first or better path to v
+          d[v] = dist
+          heappush(heap, (dist, v))
+  return cloud
+
+def _bfs_task(src):
+  return src, hop_distances(_graph, src)
+
+def _dijkstra_task(src):
+  return src, weighted_distances(_graph, src)
+
+_TASKS = {'bfs': _bfs_task, 'dijkstra': _dijkstra_task}
+
+def multi_source_distances(g, sources, method='dijkstra', processes=None):
+  """Generate (source, distances) pairs for each vertex of sources.
+
+  distances is a dictionary mapping each vertex reachable from that source
+  to its shortest-path distance (method 'dijkstra', with edge elements as
+  weights) or to its number of edges (method 'bfs').
+
+  The searches run in a pool of processes (by default, one per CPU) that
+  share a single compact CSRGraph copy of g, sent to each worker once. If g
+  was returned by graph_store.load_graph, each worker instead maps the same
+  file, whose memory-mapped arrays could not be sent (and need not be).
+  Pairs are generated in the order in which the searches complete.
+  """
+  task = _TASKS.get(method)
+  if task is None:
+    raise ValueError('method must be one of ' + ', '.join(sorted(_TASKS)))
+  path = None
+  if isinstance(g, CSRGraph):
+    csr, verts, index = g, None, None
+    if g._path is not None:                    # workers map the file directly
+      csr, path = None, g._path
+  else:
+    snapshot = CSRGraph(g)
+    verts = list(g.vertices())                 # vertex with each integer id
+    index = snapshot._index
+    # workers need only the arrays, not the vertex objects or elements
+    csr = CSRGraph._from_arrays(
+      snapshot._directed, (), snapshot._offsets, snapshot._targets,
+      snapshot._weights, snapshot._in_offsets, snapshot._in_targets,
+      snapshot._in_slots)
+  with ProcessPoolExecutor(processes, initializer=_init_worker,
+                           initargs=(csr, path)) as pool:
+    ids = sources if index is None else [index[s] for s in sources]
+    jobs = [pool.submit(task, i) for i in ids]
+    for job in as_completed(jobs):
+      src, distances = job.result()
+      if verts is not None:                    # translate ids back to vertices
+        src = verts[src]
+        distances = {verts[i]: d for i, d in distances.items()}
+      yield src, distances
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+
 class Partition:
   """Union-find structure for maintaining disjoint sets."""
   
@@ -45,25 +47,139 @@ class Partition:
       raise ValueError('p does not belong to this container')
     
   #------------------------- public Partition methods -------------------------
+  def __init__(self):
+    """Create an empty partition."""
+    self._groups = 0                      # number of distinct groups
+
   def make_group(self, e):
     """Makes a new group containing element e, and returns its Position."""
+    self._groups += 1
     return self.Position(self, e)
 
   def find(self, p):
     """Finds the group containging p and return the position of its leader."""
     self._validate(p)
-    if p._parent != p:
-      p._parent = self.find(p._parent)    # overwrite p._parent after recursion
-    return p._parent
+    leader = p
+    while leader._parent is not leader:   # walk up to the group leader
+      leader = leader._parent
+    while p is not leader:                # then compress the path behind us
+      p._parent, p = leader, p._parent
+    return leader
     
   def union(self, p, q):
-    """Merges the groups containg elements p and q (if distinct)."""
+    """Merges the groups containg elements p and q (if distinct).
+
+    Return True if they were distinct groups, False otherwise.
+    """
     a = self.find(p)
     b = self.find(q)
-    if a is not b:                        # only merge if different groups
-      if a._size > b._size:
-        b._parent = a
-        a._size += b._size
-      else:
-        a._parent = b
-        b._size += a._size
+    if a is b:                            # only merge if different groups
+      return False
+    if a._size > b._size:
+      b._parent = a
+      a._size += b._size
+    else:
+      a._parent = b
+      b._size += a._size
+    self._groups -= 1
+    return True
+
+  def same_group(self, p, q):
+    """Return True if positions p and q belong to the same group."""
+    return self.find(p) is self.find(q)
+
+  def group_size(self, p):
+    """Return the number of elements in the group containing position p."""
+    return self.find(p)._size
+
+  def group_count(self):
+    """Return the number of distinct groups."""
+    return self._groups
+
+class IndexedPartition:
+  """Array-based union-find structure over the integers 0, 1, 2, ...
+
+  Elements are identified by integer index rather than by Position, so that
+  no object is allocated per element. Union is by size and find uses path
+  halving, both without recursion.
+  """
+
+  def __init__(self, n=0):
+    """Create a partition of the integers 0 to n-1 into singleton groups."""
+    self._parent = array('q', range(n))   # parent[i] == i for a group leader
+    self._size = array('q', [1]) * n      # size of group, valid for leaders
+    self._groups = n                      # number of distinct groups
+
+  def __len__(self):
+    """Return the number of elements in the partition."""
+    return len(self._parent)
+
+  def make_group(self):
+    """Make a new group containing a new element, and return its index."""
+    i = len(self._parent)
+    self._parent.append(i)
+    self._size.append(1)
+    self._groups += 1
+    return i
+
+  def make_groups(self, k):
+    """Make k new singleton groups, and return the range of their indices."""
+    start = len(self._parent)
+    self._parent.extend(range(start, start + k))
+    self._size.extend(array('q', [1]) * k)
+    self._groups += k
+    return range(start, start + k)
+
+  def find(self, i):
+    """Return the index of the leader of the group containing element i."""
+    parent = self._parent
+    while parent[i] != i:
+      parent[i] = parent[parent[i]]       # path halving: skip to grandparent
+      i = parent[i]
+    return i
+
+  def union(self, i, j):
+    """Merge the groups containing elements i and j.
+
+    Return True if they were distinct groups, False otherwise.
+    """
+    a = self.find(i)
+    b = self.find(j)
+    if a == b:
+      return False
+    size = self._size
+    if size[a] < size[b]:
+      a, b = b, a                         # a is leader of the larger group
+    self._parent[b] = a
+    size[a] += size[b]
+    self._groups -= 1
+    return True
+
+  def same_group(self, i, j):
+    """Return True if elements i and j belong to the same group."""
+    return self.find(i) == self.find(j)
+
+  def group_size(self, i):
+    """Return the number of elements in the group containing element i."""
+    return self._size[self.find(i)]
+
+  def group_count(self):
+    """Return the number of distinct groups."""
+    return self._groups
+
+  def labels(self):
+    """Return an array assigning each element a group number.
+
+    Group numbers are 0 to group_count()-1, in order of first appearance.
+    """
+    n = len(self._parent)
+    label = array('q', [-1]) * n
+    result = array('q', [0]) * n
+    count = 0
+    for i in range(n):
+      leader = self.find(i)
+      if label[leader] < 0:
+        label[leader] = count
+        count += 1
+      result[i] = label[leader]
+    return result
@@ -0,0 +1,113 @@
+# Copyright 2013, Michael H. Goldwasser
+#
+# Developed for use with the book:
+#
+#    Data Structures and Algorithms in Python
+#    Michael T. Goodrich, Roberto Tamassia, and Michael H. Goldwasser
+#    John Wiley & Sons, 2013
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .graph import Graph
+
+def _strong_components(adj):
+  """Return strongly connected components of the graph with adjacency lists adj.
+
+  Vertices are the integers 0 to n-1. Components are returned as lists of
+  vertices, in reverse topological order of the component graph. The method
+  is Tarjan's algorithm, with an explicit stack in place of recursion.
+  """
+  n = len(adj)
+  low = [0] * n
+  number = [0] * n                   # discovery number (1-based); 0 if unseen
+  on_stack = [False] * n
+  stack = []                         # vertices of components not yet emitted
+  components = []
+  count = 0
+  for root in range(n):
+    if number[root] == 0:
+      count += 1
+      number[root] = low[root] = count
+      stack.append(root)
+      on_stack[root] = True
+      work = [(root, iter(adj[root]))]
+      while work:
+        u, neighbors = work[-1]
+        for v in neighbors:
+          if number[v] == 0:         # tree edge; explore v next
+            count += 1
+            number[v] = low[v] = count
+            stack.append(v)
+            on_stack[v] = True
+            work.append((v, iter(adj[v])))
+            break
+          elif on_stack[v] and number[v] < low[u]:
+            low[u] = number[v]
+        else:                        # u is finished
+          work.pop()
+          if work:
+            parent = work[-1][0]
+            if low[u] < low[parent]:
+              low[parent] = low[u]
+          if low[u] == number[u]:    # u is the root of a component
+            component = []
+            while True:
+              w = stack.pop()
+              on_stack[w] = False
+              component.append(w)
+              if w == u:
+                break
+            components.append(component)
+  return components
+
+def strong_component_labels(g):
+  """Return a dictionary mapping each vertex of g to its strong component.
+
+  Components are numbered 0 to c-1 in a topological order of the
+  condensation, so that label[u] <= label[v] for every edge (u,v).  Two
+  vertices have the same label if and only if each can reach the other.
+  For an undirected graph these are the connected components.
+  """
+  verts = list(g.vertices())                 # make indexable list
+  index = {v: i for i, v in enumerate(verts)}
+  adj = [[index[v] for v, e in g.neighbors(u)] for u in verts]
+  components = _strong_components(adj)
+  label = {}
+  for c, component in enumerate(reversed(components)):
+    for i in component:
+      label[verts[i]] = c
+  return label
+
+def condensation(g):
+  """Return the condensation of g, with one vertex per strong component.
+
+  The result is a pair (dag, component).  dag is a new directed acyclic
+  Graph whose vertices were inserted in topological order, each having the
+  number of vertices of its component as element; it has an edge (with
+  element None) from one component to another whenever g has an edge
+  between them.  component maps each vertex of g to its vertex of dag.
+  """
+  label = strong_component_labels(g)
+  sizes = [0] * (max(label.values()) + 1 if label else 0)
+  for c in label.values():
+    sizes[c] += 1
+  dag = Graph(directed=True)
+  nodes = [dag.insert_vertex(size) for size in sizes]
+  for u in g.vertices():
+    a = nodes[label[u]]
+    for v, e in g.neighbors(u):
+      b = nodes[label[v]]
+      if a is not b and dag.get_edge(a, b) is None:
+        dag.insert_edge(a, b)
+  return dag, {v: nodes[c] for v, c in label.items()}
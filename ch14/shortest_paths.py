@@ -20,6 +20,36 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from ..ch09.adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+from ..ch09.bucket_priority_queue import BucketPriorityQueue
+from .csr_graph import CSRGraph
+
+# Largest weight for which shortest_path_lengths uses buckets.  A bucket search
+# may step its cursor once per integer up to the largest distance, which can
+# be (n-1) times the largest weight, so only small weights keep it cheaper
+# than a heap (on a path of 2000 vertices the two break even near 100).
+_MAX_BUCKETS = 100
+
+def _weighted_neighbors(g):
+  """Return a function mapping u to (v, weight) pairs for its outgoing edges.
+
+  For a CSRGraph the pairs come straight from its arrays, so no Edge handle
+  is created for each edge examined.
+  """
+  if isinstance(g, CSRGraph):
+    adjacency = g.adjacency
+    return lambda u: zip(*adjacency(u))
+  neighbors = g.neighbors
+  return lambda u: ((v, e.element()) for v, e in neighbors(u))
+
+def _weights(g):
+  """Return an iteration of the edge weights of g.
+
+  A CSRGraph reports its weight array directly, without Edge handles (an
+  undirected edge appears twice, which does not change the range).
+  """
+  if isinstance(g, CSRGraph):
+    return g._weights
+  return (e.element() for e in g.edges())
 
 def shortest_path_lengths(g, src):
   """Compute shortest-path distances from src to reachable vertices of g.
@@ -28,16 +58,30 @@ def shortest_path_lengths(g, src):
   e.element() returns a numeric weight for each edge e.
 
   Return dictionary mapping each reachable vertex to its distance from src.
+
+  If every weight is a small nonnegative integer, the search uses buckets
+  (see bucket_shortest_path_lengths); otherwise an adaptable heap.
+  """
+  span = _integer_weight_span(g)
+  if span is not None:
+    return bucket_shortest_path_lengths(g, src, span)
+  return heap_shortest_path_lengths(g, src)
+
+def heap_shortest_path_lengths(g, src):
+  """Compute shortest-path distances using an AdaptableHeapPriorityQueue.
+
+  This is Dijkstra's algorithm for arbitrary numeric weights.
   """
   d = {}                                        # d[v] is upper bound from s to v
   cloud = {}                                    # map reachable v to its d[v] value
   pq = AdaptableHeapPriorityQueue()             # vertex v will have key d[v]
   pqlocator = {}                                # map from vertex to its pq locator
+  weighted = _weighted_neighbors(g)
 
   # for each vertex v of the graph, add an entry to the priority queue, with
   # the source having distance 0 and all others having infinite distance
   for v in g.vertices():
-    if v is src:
+    if v == src:
       d[v] = 0
     else:
       d[v] = float('inf')                       # syntax for positive infinity
@@ -47,17 +91,63 @@ def shortest_path_lengths(g, src):
     key, u = pq.remove_min()
     cloud[u] = key                              # its correct d[u] value
     del pqlocator[u]                            # u is no longer in pq
-    for e in g.incident_edges(u):               # outgoing edges (u,v)
-      v = e.opposite(u)
+    for v, wgt in weighted(u):                  # outgoing edges (u,v)
       if v not in cloud:
         # perform relaxation step on edge (u,v)
-        wgt = e.element()
         if d[u] + wgt < d[v]:                   # better path to v?
           d[v] = d[u] + wgt                     # update the distance
           pq.update(pqlocator[v], d[v], v)      # update the pq entry
 
   return cloud                                  # only includes reachable vertices
 
+def _integer_weight_span(g):
+  """Return the largest edge weight of g if all weights are small integers.
+
+  Return None if some weight is not an int, is negative, or exceeds
+  _MAX_BUCKETS, so that a bucket search would not pay off.
+  """
+  span = 0
+  for wgt in _weights(g):
+    if type(wgt) is not int or not 0 <= wgt <= _MAX_BUCKETS:
+      return None
+    if wgt > span:
+      span = wgt
+  return span
+
+def bucket_shortest_path_lengths(g, src, span=None):
+  """Compute shortest-path distances from src using a BucketPriorityQueue.
+
+  Every edge weight must be a nonnegative integer no larger than span (by
+  default, the largest weight in g).  A vertex may be added to the queue
+  several times as its distance improves; stale entries are skipped when
+  removed, so no locators are needed.
+
+  The result is the same as that of shortest_path_lengths.
+  """
+  if span is None:
+    span = max(_weights(g), default=0)
+  d = {src: 0}                                  # d[v] is upper bound from s to v
+  cloud = {}                                    # map reachable v to its d[v] value
+  pq = BucketPriorityQueue(span)
+  pq.add(0, src)
+  weighted = _weighted_neighbors(g)
+  while not pq.is_empty():
+    key, u = pq.remove_min()
+    if u in cloud:
+      continue                                  # stale entry for a settled vertex
+    cloud[u] = key                              # its correct d[u] value
+    for v, wgt in weighted(u):                  # outgoing edges (u,v)
+      if v not in cloud:
+        # perform relaxation step on edge (u,v)
+        dist = key + wgt
+        if v not in d or dist < d[v]:           # better path to v?
+          d[v] = dist
+          pq.add(dist, v)
+  for v in g.vertices():                        # as in shortest_path_lengths,
+    if v not in cloud:                          # unreachable vertices are
+      cloud[v] = float('inf')                   # removed with infinite key
+  return cloud
+
 def shortest_path_tree(g, s, d):
   """Reconstruct shortest-path tree rooted at vertex s, given distance map d.
 
@@ -66,10 +156,199 @@ def shortest_path_tree(g, s, d):
   """
   tree = {}
   for v in d:
-    if v is not s:
-      for e in g.incident_edges(v, False):       # consider INCOMING edges
-        u = e.opposite(v)
+    if v != s:
+      for u, e in g.neighbors(v, False):         # consider INCOMING edges
         wgt = e.element()
         if d[v] == d[u] + wgt:
           tree[v] = e                            # edge e is used to reach v
   return tree
+
+class ShortestPaths:
+  """Result of a single-source shortest-path search, answering path queries.
+
+  The object is immutable and may be kept to answer any number of queries.
+  """
+  __slots__ = '_source', '_distance', '_parent'
+
+  def __init__(self, source, distance, parent):
+    """Do not call constructor directly. Use shortest_path_search(g, src)."""
+    self._source = source
+    self._distance = distance                   # map reachable v to d[v]
+    self._parent = parent                       # map v to edge reaching v
+
+  def source(self):
+    """Return the source vertex of the search."""
+    return self._source
+
+  def is_reachable(self, v):
+    """Return True if v is reachable from the source."""
+    return v in self._distance
+
+  def distance(self, v):
+    """Return the shortest-path distance to v, or None if not reachable."""
+    return self._distance.get(v)
+
+  def distances(self):
+    """Return a dictionary mapping each reachable vertex to its distance."""
+    return dict(self._distance)
+
+  def edge_to(self, v):
+    """Return the edge leading to v in the tree (None for the source)."""
+    return self._parent.get(v)
+
+  def tree(self):
+    """Return tree as a map from each reachable vertex v (other than the
+    source) to the edge e=(u,v) used to reach v from its parent u.
+    """
+    return dict(self._parent)
+
+  def path_to(self, v):
+    """
+    Return a list of vertices comprising a shortest path from the source to v,
+    or an empty list if v is not reachable.
+    """
+    path = []
+    if v in self._distance:
+      # we build list from v to the source and then reverse it at the end
+      path.append(v)
+      walk = v
+      while walk != self._source:
+        walk = self._parent[walk].opposite(walk)
+        path.append(walk)
+      path.reverse()
+    return path
+
+def shortest_path_search(g, src):
+  """Compute shortest paths from src to the reachable vertices of g.
+
+  Graph g must be weighted as for shortest_path_lengths. The parent edge of
+  each vertex is recorded whenever a relaxation improves its distance, so no
+  second pass over the graph is needed. Return a ShortestPaths instance.
+  """
+  d = {src: 0}                                  # d[v] is upper bound from s to v
+  cloud = {}                                    # map reachable v to its d[v] value
+  parent = {}                                   # map v to edge giving d[v]
+  pq = AdaptableHeapPriorityQueue()             # vertex v will have key d[v]
+  pqlocator = {src: pq.add(0, src)}             # vertices enter pq when reached
+
+  while not pq.is_empty():
+    key, u = pq.remove_min()
+    cloud[u] = key                              # its correct d[u] value
+    del pqlocator[u]                            # u is no longer in pq
+    for v, e in g.neighbors(u):                 # outgoing edges (u,v)
+      if v not in cloud:
+        # perform relaxation step on edge (u,v)
+        dist = key + e.element()
+        if v not in pqlocator:                  # first path found to v
+          d[v] = dist
+          parent[v] = e
+          pqlocator[v] = pq.add(dist, v)
+        elif dist < d[v]:                       # better path to v?
+          d[v] = dist
+          parent[v] = e                         # e now reaches v
+          pq.update(pqlocator[v], dist, v)
+
+  return ShortestPaths(src, cloud, parent)
+
+def _goal_directed(g, src, dest, heuristic, cloud):
+  """Search from src until dest is settled, ordering vertices by d[v]+h(v).
+
+  Vertices enter the priority queue only when first reached.  Return the
+  distance to dest, or None if dest is not reachable.
+  """
+  d = {src: 0}                                  # d[v] is upper bound from s to v
+  pq = AdaptableHeapPriorityQueue()             # vertex v will have key d[v]+h(v)
+  pqlocator = {src: pq.add(heuristic(src), src)}
+  weighted = _weighted_neighbors(g)
+
+  while not pq.is_empty():
+    key, u = pq.remove_min()
+    cloud[u] = d[u]                             # its correct d[u] value
+    del pqlocator[u]                            # u is no longer in pq
+    if u == dest:
+      return d[u]                               # no need to settle the rest
+    for v, wgt in weighted(u):                  # outgoing edges (u,v)
+      if v not in cloud:
+        # perform relaxation step on edge (u,v)
+        dist = d[u] + wgt
+        if v not in pqlocator:                  # first path found to v
+          d[v] = dist
+          pqlocator[v] = pq.add(dist + heuristic(v), v)
+        elif dist < d[v]:                       # better path to v?
+          d[v] = dist
+          pq.update(pqlocator[v], dist + heuristic(v), v)
+
+  return None                                   # dest is not reachable
+
+def shortest_path_length(g, src, dest, cloud=None):
+  """Compute the shortest-path distance from src to dest in weighted graph g.
+
+  The search stops as soon as dest is settled. Return the distance, or None
+  if dest is not reachable from src.
+
+  If cloud is given as an empty dictionary, each vertex settled by the search
+  is added to it, mapped to its distance from src.
+  """
+  if cloud is None:
+    cloud = {}
+  return _goal_directed(g, src, dest, lambda v: 0, cloud)
+
+def astar_path_length(g, src, dest, heuristic, cloud=None):
+  """Compute the shortest-path distance from src to dest using A* search.
+
+  heuristic(v) must return a lower bound on the distance from v to dest that
+  is consistent, meaning heuristic(u) <= w + heuristic(v) for every edge
+  (u,v) of weight w.  Return the distance, or None if dest is not reachable.
+
+  If cloud is given as an empty dictionary, each vertex settled by the search
+  is added to it, mapped to its distance from src.
+  """
+  if cloud is None:
+    cloud = {}
+  return _goal_directed(g, src, dest, heuristic, cloud)
+
+def bidirectional_path_length(g, src, dest, cloud=None):
+  """Compute the shortest-path distance from src to dest in weighted graph g.
+
+  Searches proceed forward from src and backward from dest (along incoming
+  edges), always advancing the one with the smaller tentative distance, and
+  stop once no shorter path can remain. Return the distance, or None if dest
+  is not reachable from src.
+
+  If cloud is given as an empty dictionary, each vertex settled by either
+  search is added to it, mapped to its distance from that search's root.
+  """
+  if src == dest:
+    if cloud is not None:
+      cloud[src] = 0
+    return 0
+  d = ({src: 0}, {dest: 0})                     # tentative distances per side
+  settled = ({}, {})
+  pq = (AdaptableHeapPriorityQueue(), AdaptableHeapPriorityQueue())
+  pqlocator = ({src: pq[0].add(0, src)}, {dest: pq[1].add(0, dest)})
+  best = float('inf')                           # length of best path found
+
+  while not pq[0].is_empty() and not pq[1].is_empty():
+    top0, top1 = pq[0].min()[0], pq[1].min()[0]
+    if top0 + top1 >= best:
+      break                                     # no shorter path remains
+    side = 0 if top0 <= top1 else 1
+    other = 1 - side
+    key, u = pq[side].remove_min()
+    del pqlocator[side][u]
+    settled[side][u] = key
+    if cloud is not None:
+      cloud[u] = key
+    for v, e in g.neighbors(u, side == 0):      # backward search uses incoming
+      if v not in settled[side]:
+        dist = key + e.element()
+        if v not in pqlocator[side]:            # first path found to v
+          d[side][v] = dist
+          pqlocator[side][v] = pq[side].add(dist, v)
+        elif dist < d[side][v]:                 # better path to v?
+          d[side][v] = dist
+          pq[side].update(pqlocator[side][v], dist, v)
+        if v in d[other] and dist + d[other][v] < best:
+          best = dist + d[other][v]             # searches meet at v
+
+  return best if best < float('inf') else None
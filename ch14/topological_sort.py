@@ -34,13 +34,117 @@ def topological_sort(g):
   while len(ready) > 0:
     u = ready.pop()                  # u is free of constraints
     topo.append(u)                   # add u to the topological order
-    for e in g.incident_edges(u):    # consider all outgoing neighbors of u
-      v = e.opposite(u)
+    for v, e in g.neighbors(u):      # consider all outgoing neighbors of u
       incount[v] -= 1                # v has one less constraint without u
       if incount[v] == 0:
         ready.append(v)
   return topo
 
+class CycleError(ValueError):
+  """Error raised when a graph that must be acyclic contains a cycle."""
+
+  def __init__(self, vertices):
+    super().__init__('graph contains a cycle')
+    self.vertices = vertices        # vertices lying on (or between) cycles
+
+def _cycle_vertices(g, incount):
+  """Return the vertices left unordered by Kahn's algorithm that lie on cycles.
+
+  incount maps each vertex to its remaining in-degree. Vertices that are
+  merely downstream of a cycle are pruned by repeatedly discarding those
+  with no outgoing edge to another remaining vertex.
+  """
+  remaining = {u for u in incount if incount[u] > 0}
+  outcount = {}
+  sinks = []
+  for u in remaining:
+    outcount[u] = sum(1 for v, e in g.neighbors(u) if v in remaining)
+    if outcount[u] == 0:
+      sinks.append(u)
+  while sinks:
+    u = sinks.pop()
+    remaining.discard(u)
+    for w, e in g.neighbors(u, False):     # predecessors lose an outgoing edge
+      if w in remaining:
+        outcount[w] -= 1
+        if outcount[w] == 0:
+          sinks.append(w)
+  return remaining
+
+def topological_layers(g):
+  """Return the vertices of directed acyclic graph g as a list of layers.
+
+  Each layer is a list of vertices whose predecessors all lie in earlier
+  layers, so the vertices of one layer may be processed in parallel.
+
+  Raise CycleError, with the offending vertices, if g has a cycle.
+  """
+  layers = []
+  incount = {}          # keep track of in-degree for each vertex
+  ready = []
+  for u in g.vertices():
+    incount[u] = g.degree(u, False)  # parameter requests incoming degree
+    if incount[u] == 0:              # if u has no incoming edges,
+      ready.append(u)                # it is free of constraints
+  placed = 0
+  while len(ready) > 0:
+    layers.append(ready)
+    placed += len(ready)
+    next_ready = []
+    for u in ready:
+      for v, e in g.neighbors(u):    # consider all outgoing neighbors of u
+        incount[v] -= 1              # v has one less constraint without u
+        if incount[v] == 0:
+          next_ready.append(v)
+    ready = next_ready
+  if placed < len(incount):
+    raise CycleError(_cycle_vertices(g, incount))
+  return layers
+
+def _longest_paths(g):
+  """Return (length, parent) maps describing longest paths of DAG g.
+
+  length[v] is the greatest weight of a path ending at v, and parent[v] is
+  the last edge of such a path (None if the path is empty).
+  """
+  length = {}
+  parent = {}
+  for layer in topological_layers(g):
+    for u in layer:                  # predecessors are already finalized
+      length[u] = 0
+      parent[u] = None
+      for w, e in g.neighbors(u, False):
+        candidate = length[w] + e.element()
+        if candidate > length[u]:
+          length[u] = candidate
+          parent[u] = e
+  return length, parent
+
+def critical_path_lengths(g):
+  """Return map from each vertex of DAG g to the longest path ending there.
+
+  The elements of the graph's edges are assumed to be weights (durations).
+  The largest value is the length of a critical path of the whole graph.
+  Raise CycleError if g has a cycle.
+  """
+  return _longest_paths(g)[0]
+
+def critical_path(g):
+  """Return a list of vertices forming a longest weighted path of DAG g.
+
+  Raise CycleError if g has a cycle.
+  """
+  length, parent = _longest_paths(g)
+  if not length:
+    return []
+  walk = max(length, key=length.get)  # end of a critical path
+  path = [walk]
+  while parent[walk] is not None:
+    walk = parent[walk].opposite(walk)
+    path.append(walk)
+  path.reverse()
+  return path
+
 if __name__ == '__main__':
   from .graph_examples import figure_14_12 as example
   g = example()
@@ -48,3 +152,5 @@ if __name__ == '__main__':
   print("Number of edges is", g.edge_count())
   topo = topological_sort(g)
   print("Topo order", [str(v) for v in topo])
+  layers = topological_layers(g)
+  print("Layers", [[str(v) for v in layer] for layer in layers])
@@ -20,6 +20,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from copy import deepcopy
+from .graph import Graph
+from .scc import _strong_components
 
 def floyd_warshall(g):
   """Return a new graph that is the transitive closure of g."""
@@ -38,6 +40,109 @@ def floyd_warshall(g):
               closure.insert_edge(verts[i],verts[j])
   return closure
 
+class ReachabilityMatrix:
+  """Reachability relation of a graph, with one integer bitset per vertex.
+
+  Bit j of the row for the vertex with index i is set if the vertex with
+  index j can be reached from it. Every vertex is considered to reach itself.
+  """
+
+  def __init__(self, g, verts, rows):
+    """Do not call constructor directly. Use reachability(g)."""
+    self._graph = g
+    self._verts = verts                      # indexable list of vertices
+    self._index = {v: i for i, v in enumerate(verts)}
+    self._rows = rows                        # rows may be shared by vertices
+
+  def reachable(self, u, v):
+    """Return True if there is a path from vertex u to vertex v."""
+    if u == v:
+      return True
+    return (self._rows[self._index[u]] >> self._index[v]) & 1 == 1
+
+  def _members(self, i):
+    """Generate indices of the bits set in row i, in increasing order."""
+    bits = bin(self._rows[i])[:1:-1]         # least significant bit first
+    j = bits.find('1')
+    while j >= 0:
+      yield j
+      j = bits.find('1', j + 1)
+
+  def reachable_from(self, u):
+    """Return a list of the vertices reachable from vertex u (including u)."""
+    i = self._index[u]
+    result = [self._verts[j] for j in self._members(i)]
+    if not (self._rows[i] >> i) & 1:
+      result.append(u)
+    return result
+
+  def to_graph(self):
+    """Return a new graph that is the transitive closure of the original.
+
+    Vertices and edges of the original keep their elements; new edges have
+    element None. As with floyd_warshall, no self-loops are added.
+    """
+    g = self._graph
+    closure = Graph(g.is_directed())
+    verts = [closure.insert_vertex(v.element()) for v in self._verts]
+    undirected = not g.is_directed()
+    for i, u in enumerate(self._verts):
+      for j in self._members(i):
+        if i != j and not (undirected and j < i):
+          e = g.get_edge(u, self._verts[j])
+          closure.insert_edge(verts[i], verts[j],
+                              None if e is None else e.element())
+    return closure
+
+def reachability(g, condense=True):
+  """Return a ReachabilityMatrix describing which vertices of g reach which.
+
+  If condense is True (the default), strongly connected components are found
+  first and rows are computed once per component, in reverse topological
+  order, by OR-ing the rows of successor components; vertices of the same
+  component share one row. This takes O(n+m) bitset operations.
+
+  Otherwise Warshall's algorithm is applied to the vertex rows, OR-ing a
+  whole row at a time, for O(n^2) bitset operations.
+  """
+  verts = list(g.vertices())                 # make indexable list
+  index = {v: i for i, v in enumerate(verts)}
+  n = len(verts)
+  adj = [[index[v] for v, e in g.neighbors(u)] for u in verts]
+  if condense:
+    rows = [0] * n
+    label = [0] * n                          # component of each vertex
+    for c, component in enumerate(_strong_components(adj)):
+      row = 0
+      for i in component:
+        label[i] = c
+        row |= 1 << i
+      for i in component:
+        for j in adj[i]:
+          if label[j] != c:                  # successors are already done
+            row |= rows[j]
+      for i in component:
+        rows[i] = row                        # shared by whole component
+  else:
+    rows = [0] * n
+    for i in range(n):
+      for j in adj[i]:
+        rows[i] |= 1 << j
+    for k in range(n):
+      bit = 1 << k
+      row_k = rows[k]
+      for i in range(n):
+        if rows[i] & bit:                    # i reaches k, thus all k reaches
+          rows[i] |= row_k
+  return ReachabilityMatrix(g, verts, rows)
+
+def transitive_closure(g):
+  """Return a new graph that is the transitive closure of g.
+
+  This produces the same result as floyd_warshall using bitset reachability.
+  """
+  return reachability(g).to_graph()
+
 if __name__ == '__main__':
   from graph_examples import figure_14_11 as example
   g = example()